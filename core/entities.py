@@ -15,9 +15,13 @@ class BallType(Enum):
     VOLLEYBALL = "volleyball"  # Quaffle
     DODGEBALL = "dodgeball"    # Bludger
 
-@dataclass
+@dataclass(slots=True)
 class Vector2:
-    """Simple 2D vector for positions and velocities."""
+    """Simple 2D vector for positions and velocities.
+
+    Slotted, because x/y of positions and velocities are the most accessed attributes
+    in the game logic and no other attributes are ever assigned to a vector.
+    """
     x: float
     y: float
     
@@ -30,6 +34,11 @@ class Vector2:
     def __mul__(self, scalar: float) -> 'Vector2':
         return Vector2(self.x * scalar, self.y * scalar)
     
+    def iadd(self, other_x: float, other_y: float) -> None:
+        """Shift the vector in place, without allocating a new Vector2."""
+        self.x += other_x
+        self.y += other_y
+
     def to_tuple(self) -> Tuple[float, float]:
         return (self.x, self.y)
 
@@ -62,7 +71,7 @@ class Vector2:
     def from_dict(d: dict) -> 'Vector2':
         return Vector2(d["x"], d["y"])
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """Represents a player in the game."""
     id: str                                    # Unique player identifier
@@ -156,7 +165,7 @@ class Player:
         return copied
     
 
-@dataclass
+@dataclass(slots=True)
 class Ball:
     """Represents a ball in the game (quaffle, bludger, or snitch)."""
     id: str                           # Unique ball identifier
@@ -220,6 +229,9 @@ class Ball:
 
 class VolleyBall(Ball):
     """Represents the quaffle (volleyball) in quadball."""
+    # same order as assigned in __init__, RoomJsonlLogger encodes these positionally
+    __slots__ = ('crossed_hoop', 'inbounder', 'is_dead', 'delay_of_game_timer')
+
     def __init__(self,
                 id: str,
                 radius: float,
@@ -279,6 +291,9 @@ class VolleyBall(Ball):
 
 class DodgeBall(Ball):
     """Represents a dodgeball (bludger) in quadball."""
+    # same order as assigned in __init__, RoomJsonlLogger encodes these positionally
+    __slots__ = ('beat_attempt_time', 'dead_velocity_threshold')
+
     def __init__(self,
                 id: str,
                 radius: float,
@@ -1,8 +1,9 @@
 import logging
+import math
 from typing import Tuple
-from core.game_logic.utility_logic import UtilityLogic
+from core.game_logic.utility_logic import UtilityLogic, CENTER_HOOP_IDS
 from core.game_state import GameState
-from core.entities import Player, Ball, VolleyBall, DodgeBall, Vector2, PlayerRole, BallType
+from core.entities import Player, Ball, VolleyBall, DodgeBall, PlayerRole, BallType
 
 BASE_LOGGER = logging.getLogger('quadball.game_logic')
 
@@ -26,6 +27,7 @@ class BasicLogic:
         self.state = game_state
         self.penalty_logic = penalty_logic
         self.logger = logger or BASE_LOGGER
+        self._ball_collision_distances_sq: dict[str, dict[str, float]] | None = None
 
     def update_player_velocity(self, player: Player, dt: float):
         """Integrate one player's velocity from input direction and movement parameters.
@@ -42,30 +44,46 @@ class BasicLogic:
             dt: Delta game time since last frame in seconds.
         """
         # norm player.direction
-        mag_dir = UtilityLogic._magnitude(player.direction)
+        # direction and velocity are read into locals once and written back once
+        direction = player.direction
+        velocity = player.velocity
+        direction_x = direction.x
+        direction_y = direction.y
+        mag_dir = math.hypot(direction_x, direction_y)
         # on stick reset check before direction norm
-        if player.is_knocked_out and (mag_dir < player.radius + self.state.hoops[f'hoop_{player.team}_center'].thickness):
+        if player.is_knocked_out and (mag_dir < player.radius + self.state.hoops[CENTER_HOOP_IDS[player.team]].thickness):
             player.is_knocked_out = False
             self.logger.info("Player %s has recovered from knockout", player.id)
         if mag_dir > 1:
-            player.direction.x /= mag_dir
-            player.direction.y /= mag_dir
+            # one division, two multiplications instead of two divisions
+            inv_mag_dir = 1.0 / mag_dir
+            direction_x *= inv_mag_dir
+            direction_y *= inv_mag_dir
+            direction.x = direction_x
+            direction.y = direction_y
         elif mag_dir < player.min_dir:
-            player.direction.x = 0
-            player.direction.y = 0
-        player.velocity.x = player.velocity.x + ( - player.deacceleration_rate * player.velocity.x + player.direction.x * player.acceleration) * dt
-        player.velocity.y = player.velocity.y + ( - player.deacceleration_rate * player.velocity.y + player.direction.y * player.acceleration) * dt
+            direction_x = 0
+            direction_y = 0
+            direction.x = 0
+            direction.y = 0
+        deacceleration_rate = player.deacceleration_rate
+        acceleration = player.acceleration
+        velocity_x = velocity.x
+        velocity_y = velocity.y
+        velocity_x = velocity_x + ( - deacceleration_rate * velocity_x + direction_x * acceleration) * dt
+        velocity_y = velocity_y + ( - deacceleration_rate * velocity_y + direction_y * acceleration) * dt
         
         # Cap speed
-        speed = UtilityLogic._magnitude(player.velocity)
+        speed = math.hypot(velocity_x, velocity_y)
         if speed > player.max_speed:
             scale = player.max_speed / speed
-            player.velocity.x *= scale
-            player.velocity.y *= scale
+            velocity_x *= scale
+            velocity_y *= scale
         elif (speed < player.min_speed) and (mag_dir < player.min_dir):
-            player.velocity.x = 0
-            player.velocity.y = 0
-        # print('speed', (player.velocity.x**2 + player.velocity.y**2) ** 0.5)
+            velocity_x = 0
+            velocity_y = 0
+        velocity.x = velocity_x
+        velocity.y = velocity_y
 
     def update_player_velocities(self, dt: float) -> None:
         """
@@ -84,8 +102,9 @@ class BasicLogic:
         for player in self.state.players.values():
             # Update player velocity based on direction and current state
             if player.is_knocked_out:
-                player.direction.x = self.state.hoops[f'hoop_{player.team}_center'].position.x - player.position.x
-                player.direction.y = self.state.hoops[f'hoop_{player.team}_center'].position.y - player.position.y
+                hoop_position = self.state.hoops[CENTER_HOOP_IDS[player.team]].position
+                player.direction.x = hoop_position.x - player.position.x
+                player.direction.y = hoop_position.y - player.position.y
             elif volleyball is not None:
                 if volleyball.is_dead:
                     if volleyball.possession_team == player.team and player.role == PlayerRole.KEEPER:
@@ -104,23 +123,24 @@ class BasicLogic:
                 if not player.is_knocked_out: 
                     ball = self.state.balls[player.inbounding]
                     squared_distance_to_ball = UtilityLogic._squared_distance(player.position, ball.position)
-                    if squared_distance_to_ball > (player.radius + ball.radius) ** 2:
+                    reach_distance = player.radius + ball.radius
+                    if squared_distance_to_ball > reach_distance * reach_distance:
                         # not reached ball during inbounding
                         player.direction.x = ball.position.x - player.position.x
                         player.direction.y = ball.position.y - player.position.y
                     else:
                         # perpendicular inbounding direction or 45 degree angle away from boundary if on corner
-                        player.direction.x = 0
-                        player.direction.y = 0
-                        if ball.position.x <= self.state.boundaries_x[0] + player.radius: # left boundary
-                            player.direction.x += 1
-                        elif ball.position.x >= self.state.boundaries_x[1] - player.radius: # right boundary
-                            player.direction.x -= 1
-                        if ball.position.y <= self.state.boundaries_y[0] + player.radius: # bottom boundary
-                            player.direction.y += 1
-                        elif ball.position.y >= self.state.boundaries_y[1] - player.radius: # top boundary
-                            player.direction.y -= 1
-                        self.logger.debug("Inbounding direction: (%s, %s)", player.direction.x, player.direction.y)
+                        # +1 at the left/bottom boundary, -1 at the right/top boundary, 0 otherwise
+                        # (the pitch is wider than two player radii, so never both at once)
+                        ball_x = ball.position.x
+                        ball_y = ball.position.y
+                        player_radius = player.radius
+                        boundaries_x = self.state.boundaries_x
+                        boundaries_y = self.state.boundaries_y
+                        player.direction.x = (ball_x <= boundaries_x[0] + player_radius) - (ball_x >= boundaries_x[1] - player_radius)
+                        player.direction.y = (ball_y <= boundaries_y[0] + player_radius) - (ball_y >= boundaries_y[1] - player_radius)
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug("Inbounding direction: (%s, %s)", player.direction.x, player.direction.y)
                         player.velocity.x = 0
                         player.velocity.y = 0
                         ball.inbounder = None
@@ -177,59 +197,111 @@ class BasicLogic:
         Args:
             dt: Delta game time (game time since last frame) in seconds
         """
+        # bound once, the holder and turnover lookups happen per ball
+        get_player = self.state.players.get
         for ball in self.state.balls.values():
             if ball.turnover_to_player is not None:
-                self.logger.debug("Ball turnover to player velocity: %s", ball.turnover_to_player)
-                player = self.state.players.get(ball.turnover_to_player)
+                # logged every frame while the turnover lasts, so only when debugging
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Ball turnover to player velocity: %s", ball.turnover_to_player)
+                player = get_player(ball.turnover_to_player)
                 # reset turnover to other eligible player if player unavailable
                 if player is None:
                     self.penalty_logic._designate_turnover(ball)
                 elif player.is_knocked_out:
                     self.penalty_logic._designate_turnover(ball)
-                player = self.state.players.get(ball.turnover_to_player)
+                player = get_player(ball.turnover_to_player)
                 if player is not None:
                     if not player.is_knocked_out:
                         ball.velocity.x = player.position.x - ball.position.x
                         ball.velocity.y = player.position.y - ball.position.y
                         mag_dir = UtilityLogic._magnitude(ball.velocity)
                         if mag_dir > player.throw_velocity:
-                            ball.velocity.x = ball.velocity.x / mag_dir * player.throw_velocity
-                            ball.velocity.y = ball.velocity.y / mag_dir * player.throw_velocity  
+                            scale = player.throw_velocity / mag_dir
+                            ball.velocity.x *= scale
+                            ball.velocity.y *= scale
             elif ball.holder_id is None:
                 # Free balls experience friction/deceleration
-                ball.velocity.x, ball.velocity.y = self.get_free_ball_velocity(ball, dt)
+                # same as get_free_ball_velocity, inlined to skip the call and the returned tuple per ball
+                velocity = ball.velocity
+                velocity_x = velocity.x
+                velocity_y = velocity.y
+                deacceleration_rate = ball.deacceleration_rate
+                velocity_x = velocity_x - deacceleration_rate * velocity_x * dt
+                velocity_y = velocity_y - deacceleration_rate * velocity_y * dt
+                velocity.x = velocity_x
+                velocity.y = velocity_y
                 # if dodgeball below threshold then dead
                 if ball.ball_type == BallType.DODGEBALL:
-                    squared_velocity_mag = UtilityLogic._squared_sum(ball.velocity.x, ball.velocity.y)
-                    if squared_velocity_mag < ball.dead_velocity_threshold **2:
+                    squared_velocity_mag = velocity_x * velocity_x + velocity_y * velocity_y
+                    if squared_velocity_mag < ball.dead_velocity_threshold * ball.dead_velocity_threshold:
                         ball.possession_team = None                    
             else:
                 # Held balls move with the player holding them
-                holder = self.state.get_player(ball.holder_id)
+                holder = get_player(ball.holder_id)
                 if holder:
                     ball.velocity.x = holder.velocity.x
                     ball.velocity.y = holder.velocity.y
 
+    def _get_ball_collision_distances_sq(self) -> dict[str, dict[str, float]]:
+        """
+        Return the squared radius sums of all ball pairs, nested by ball id like the distance dicts.
+
+        Ball radii do not change during a game, so the table is cached and only rebuilt
+        when the set of ball ids changes.
+        """
+        balls = self.state.balls
+        if self._ball_collision_distances_sq is None or self._ball_collision_distances_sq.keys() != balls.keys():
+            ball_collision_distances_sq = {}
+            for ball_1 in balls.values():
+                ball_1_collision_distances_sq = {}
+                for ball_2 in balls.values():
+                    if ball_2 is not ball_1:
+                        collision_dist = ball_1.radius + ball_2.radius
+                        ball_1_collision_distances_sq[ball_2.id] = collision_dist * collision_dist
+                ball_collision_distances_sq[ball_1.id] = ball_1_collision_distances_sq
+            self._ball_collision_distances_sq = ball_collision_distances_sq
+        return self._ball_collision_distances_sq
+
     def get_update_position(self, entity: object, dt: float) -> Tuple[float, float]:
         """Update position of a player or ball based on its velocity."""
         return entity.position.x + entity.velocity.x * dt, entity.position.y + entity.velocity.y * dt
 
     def update_positions(self, dt: float) -> None:
-        """Update positions of players and balls based on their velocities."""
+        """Update positions of players and balls based on their velocities.
+
+        Storing the previous position and advancing the position happen in the same
+        pass per entity, reading each vector only once. The velocity integration itself
+        stays in update_player_velocities because player collisions and tackles modify
+        the velocities in between.
+        """
         for player in self.state.players.values():
-            player.previous_position.x = player.position.x
-            player.previous_position.y = player.position.y
-            player.position.x, player.position.y = self.get_update_position(player, dt)
-            # print(f'Player {player.id} position: {player.position.x}, {player.position.y}')
-            if player.catch_cooldown > dt:
-                player.catch_cooldown -= dt
-            else:
+            position = player.position
+            velocity = player.velocity
+            previous_position = player.previous_position
+            position_x = position.x
+            position_y = position.y
+            previous_position.x = position_x
+            previous_position.y = position_y
+            position.x = position_x + velocity.x * dt
+            position.y = position_y + velocity.y * dt
+            # most players have no cooldown running, they are left untouched instead of rewritten with 0.0
+            catch_cooldown = player.catch_cooldown
+            if catch_cooldown > dt:
+                player.catch_cooldown = catch_cooldown - dt
+            elif catch_cooldown != 0.0:
                 player.catch_cooldown = 0.0
-        
+
         for ball in self.state.balls.values():
-            ball.previous_position.x = ball.position.x
-            ball.previous_position.y = ball.position.y
-            ball.position.x, ball.position.y = self.get_update_position(ball, dt)
+            position = ball.position
+            velocity = ball.velocity
+            previous_position = ball.previous_position
+            position_x = position.x
+            position_y = position.y
+            previous_position.x = position_x
+            previous_position.y = position_y
+            position.x = position_x + velocity.x * dt
+            position.y = position_y + velocity.y * dt
             
     
     def _check_ball_collisions(self):
@@ -247,62 +319,77 @@ class BasicLogic:
         - Both stationary: No collision processing (prevents unnecessary computation)
         - Zero collision normal: Skips to avoid division by zero
         """
-        # Check if balls are close enough to other balls to collide
-        balls = list(self.state.balls.values())
-        n_balls = len(balls)
-        for i, ball_1 in enumerate(balls):
-            if ball_1.ball_type == BallType.VOLLEYBALL:
-                if ball_1.is_dead:
+        # Mask out balls that cannot collide once per ball instead of once per pair
+        free_balls = []
+        for ball in self.state.balls.values():
+            if ball.ball_type == BallType.VOLLEYBALL:
+                if ball.is_dead:
                     continue # dead volleyball does not collide
-            if ball_1.turnover_to_player is not None:
+            if ball.turnover_to_player is not None:
                 continue # balls in turnover do not collide
-            if ball_1.holder_id is not None:
+            if ball.holder_id is not None:
                 continue # only check free balls
-            for j in range(i + 1, n_balls):
-                ball_2 = balls[j]
-                if ball_2.ball_type == BallType.VOLLEYBALL:
-                    if ball_2.is_dead:
-                        continue # dead volleyball does not collide
-                if ball_2.turnover_to_player is not None:
-                    continue # balls in turnover do not collide
-                if ball_2.holder_id is not None:
-                    continue # only check free balls
+            free_balls.append(ball)
+        n_free_balls = len(free_balls)
+        # the ball-ball distances of this frame are already calculated, so pairs only need a lookup as broad phase
+        ball_ball_dicts = self.state.squared_distances_ball_ball_dicts
+        ball_collision_distances_sq = self._get_ball_collision_distances_sq()
+        # Check if balls are close enough to other balls to collide
+        for i in range(n_free_balls - 1):
+            ball_1 = free_balls[i]
+            ball_1_distances = ball_ball_dicts[ball_1.id]
+            ball_1_collision_distances_sq = ball_collision_distances_sq[ball_1.id]
+            for j in range(i + 1, n_free_balls):
+                ball_2 = free_balls[j]
                 # dist_sq = GameLogic._squared_distance(ball_1.position, ball_2.position)
-                dist_sq = self.state.squared_distances_ball_ball_dicts[ball_1.id][ball_2.id]
-                collision_dist_sq = (ball_1.radius + ball_2.radius) ** 2
-                if dist_sq < collision_dist_sq:
+                dist_sq = ball_1_distances[ball_2.id]
+                if dist_sq < ball_1_collision_distances_sq[ball_2.id]:
                     # Collision occurred
-                    ball_1_velocity_mag = UtilityLogic._magnitude(ball_1.velocity)
-                    ball_2_velocity_mag = UtilityLogic._magnitude(ball_2.velocity)
-                    if ball_1_velocity_mag == 0 and ball_2_velocity_mag == 0:
+                    # zero checks on the squared speeds, square roots only once the collision is resolved
+                    # velocity components read once into locals and written back once per ball
+                    velocity_1 = ball_1.velocity
+                    velocity_2 = ball_2.velocity
+                    velocity_1_x = velocity_1.x
+                    velocity_1_y = velocity_1.y
+                    velocity_2_x = velocity_2.x
+                    velocity_2_y = velocity_2.y
+                    ball_1_velocity_mag_sq = velocity_1_x * velocity_1_x + velocity_1_y * velocity_1_y
+                    ball_2_velocity_mag_sq = velocity_2_x * velocity_2_x + velocity_2_y * velocity_2_y
+                    if ball_1_velocity_mag_sq == 0 and ball_2_velocity_mag_sq == 0:
                         continue # avoid divide by zero
-                    if ball_1_velocity_mag == 0:
-                        ball_1.velocity.x = ball_2.velocity.x
-                        ball_1.velocity.y = ball_2.velocity.y
-                        ball_2.velocity.x = 0
-                        ball_2.velocity.y = 0
+                    if ball_1_velocity_mag_sq == 0:
+                        velocity_1.x = velocity_2_x
+                        velocity_1.y = velocity_2_y
+                        velocity_2.x = 0
+                        velocity_2.y = 0
                         continue
-                    if ball_2_velocity_mag == 0:
-                        ball_2.velocity.x = ball_1.velocity.x
-                        ball_2.velocity.y = ball_1.velocity.y
-                        ball_1.velocity.x = 0
-                        ball_1.velocity.y = 0
+                    if ball_2_velocity_mag_sq == 0:
+                        velocity_2.x = velocity_1_x
+                        velocity_2.y = velocity_1_y
+                        velocity_1.x = 0
+                        velocity_1.y = 0
                         continue # avoid divide by zero
-                    normal = Vector2(
-                        ball_2.position.x - ball_1.position.x,
-                        ball_2.position.y - ball_1.position.y
-                    )
-                    normal_mag = UtilityLogic._magnitude(normal)
+                    position_1 = ball_1.position
+                    position_2 = ball_2.position
+                    normal_x = position_2.x - position_1.x
+                    normal_y = position_2.y - position_1.y
+                    normal_mag = UtilityLogic._magnitude_without_vector(normal_x, normal_y)
                     if normal_mag == 0:
                         continue # avoid divide by zero
-                    normal.x /= normal_mag
-                    normal.y /= normal_mag
-                    # Reflect velocities
-                    ball_1.velocity = ball_1.velocity.reflect(normal)
-                    ball_2.velocity = ball_2.velocity.reflect(Vector2(-normal.x, -normal.y))
-                    mag_velocity_ratio = ball_1_velocity_mag / ball_2_velocity_mag
-                    ball_1.velocity.x *= 1 / mag_velocity_ratio
-                    ball_1.velocity.y *= 1 / mag_velocity_ratio
-                    ball_2.velocity.x *= mag_velocity_ratio
-                    ball_2.velocity.y *= mag_velocity_ratio
-                    self.logger.debug("Ball %s collided with Ball %s", ball_1.id, ball_2.id)
+                    inv_normal_mag = 1.0 / normal_mag
+                    normal_x *= inv_normal_mag
+                    normal_y *= inv_normal_mag
+                    # Reflect velocities: v - 2 * (v . n) * n, the sign of the normal cancels out
+                    # so both balls reflect at the same normal. The speeds are swapped by the
+                    # magnitude ratio in the same write, one factor per ball.
+                    mag_velocity_ratio = math.sqrt(ball_1_velocity_mag_sq / ball_2_velocity_mag_sq)
+                    factor_1 = 1 / mag_velocity_ratio
+                    dot_1 = velocity_1_x * normal_x + velocity_1_y * normal_y
+                    dot_2 = velocity_2_x * normal_x + velocity_2_y * normal_y
+                    velocity_1.x = (velocity_1_x - 2 * dot_1 * normal_x) * factor_1
+                    velocity_1.y = (velocity_1_y - 2 * dot_1 * normal_y) * factor_1
+                    velocity_2.x = (velocity_2_x - 2 * dot_2 * normal_x) * mag_velocity_ratio
+                    velocity_2.y = (velocity_2_y - 2 * dot_2 * normal_y) * mag_velocity_ratio
+                    # overlapping balls collide on consecutive frames, so only when debugging
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug("Ball %s collided with Ball %s", ball_1.id, ball_2.id)
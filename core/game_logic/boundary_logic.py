@@ -1,12 +1,17 @@
 import logging
+import math
 import random
-from core.game_logic.utility_logic import UtilityLogic
 from core.game_state import GameState
 from core.entities import Player, Ball, VolleyBall, DodgeBall, Vector2, PlayerRole, BallType
 from typing import Optional
 
 BASE_LOGGER = logging.getLogger('quadball.game_logic')
 
+# move away jitter range, drawn as JITTER_MIN + JITTER_SPAN * random() (same values as random.uniform)
+JITTER_MIN = 0.95
+JITTER_SPAN = 1.05 - JITTER_MIN
+PERPENDICULAR_SIGNS = (-1, 1)
+
 class BoundaryLogic:
     """
     Enforces play area boundaries, hoop blockage, and inbounding free ways.
@@ -24,6 +29,9 @@ class BoundaryLogic:
         """
         self.state = game_state
         self.logger = logger or BASE_LOGGER
+        self._team_hoop_zones: dict[int, tuple[float, float, list[tuple[float, float, float]]]] | None = None
+        self._team_hoop_zones_n_hoops = 0
+        self._free_way_squared_distances: dict[str, float] | None = None
 
     def _enforce_hoop_blockage(self) -> None:
         """
@@ -38,47 +46,76 @@ class BoundaryLogic:
         # Only for players which are not knocked out
         # if player in same team as hoop and within player.radius of the square of hoop thickness and hoop radius
         # reset position to previous position
-        volleyball = self.state.volleyball
-        for player in self.state.players.values():
-            if player.role == PlayerRole.CHASER:
-                for hoop in self.state.hoops.values():
-                    if hoop.team == player.team:
-                        if player.inbounding is None:
-                            if not player.is_knocked_out: # knocked out players can reset
-                                if player.team == self.state.team_0:
-                                    if not (
-                                        (player.position.x < hoop.position.x + player.radius + volleyball.radius) and (player.position.x > hoop.position.x - player.radius - volleyball.radius)
-                                    ):
-                                        continue # not close enough own hoops 
-                                elif player.team == self.state.team_1:
-                                    if not (
-                                        (player.position.x > hoop.position.x - player.radius - volleyball.radius) and (player.position.x < hoop.position.x + player.radius + volleyball.radius)
-                                    ):
-                                        continue # not close enough own hoops
-                                # Include the player radius, like the x margin does: a chaser
-                                # blocks the hoop with their body, not just with their centre.
-                                y_margin = hoop.radius + player.radius
-                                if (player.position.y < hoop.position.y + y_margin) and (player.position.y > hoop.position.y - y_margin):
-                                    # reset x position to outside hoop area
-                                    if player.position.x < hoop.position.x:
-                                        reset_vector = hoop.position.x - player.radius - volleyball.radius - player.position.x
-                                        player.position.x = hoop.position.x - player.radius - volleyball.radius
-                                    else:
-                                        reset_vector = hoop.position.x + player.radius + volleyball.radius - player.position.x
-                                        player.position.x = hoop.position.x + player.radius + volleyball.radius
-                                    player.velocity.x = 0
-                                    player.velocity.y = 0
-                                    if player.has_ball:
-                                        ball = self.state.get_ball(player.has_ball)
-                                        if ball:
-                                            ball.position.x = ball.position.x + reset_vector
-                                            ball.velocity.x = 0
-                                            ball.velocity.y = 0
-                                    for contact_player_id in player.in_contact_player_ids:
-                                        contact_player = self.state.players[contact_player_id]
-                                        contact_player.position.x = contact_player.position.x + reset_vector
-                                    break
-                                # print(f'Player {player.id} blocked from going too close to own hoop')
+        state = self.state
+        players = state.players
+        volleyball = state.volleyball
+        team_hoop_zones = self._get_team_hoop_zones()
+        volleyball_radius = volleyball.radius
+        for player in players.values():
+            if player.role != PlayerRole.CHASER:
+                continue
+            if player.inbounding is not None or player.is_knocked_out: # knocked out players can reset
+                continue
+            team_hoop_zone = team_hoop_zones.get(player.team)
+            if team_hoop_zone is None:
+                continue # no own hoops
+            hoops_min_x, hoops_max_x, own_hoops = team_hoop_zone
+            player_x = player.position.x
+            player_radius = player.radius
+            blocking_distance_x = player_radius + volleyball_radius
+            # hoops are static: skip the per hoop checks when the chaser is not even within the x range of all own hoops
+            if player_x <= hoops_min_x - blocking_distance_x or player_x >= hoops_max_x + blocking_distance_x:
+                continue
+            player_y = player.position.y
+            for hoop_x, hoop_y, hoop_radius in own_hoops:
+                # zone edges computed once per hoop, reused for the test and the reset below
+                block_min_x = hoop_x - blocking_distance_x
+                block_max_x = hoop_x + blocking_distance_x
+                if not (block_min_x < player_x < block_max_x):
+                    continue # not close enough own hoops
+                # Include the player radius, like the x margin does: a chaser
+                # blocks the hoop with their body, not just with their centre.
+                y_margin = hoop_radius + player_radius
+                if hoop_y - y_margin < player_y < hoop_y + y_margin:
+                    # reset x position to outside hoop area
+                    if player_x < hoop_x:
+                        reset_vector = block_min_x - player_x
+                        player.position.x = block_min_x
+                    else:
+                        reset_vector = block_max_x - player_x
+                        player.position.x = block_max_x
+                    player.velocity.x = 0
+                    player.velocity.y = 0
+                    if player.has_ball:
+                        ball = state.get_ball(player.has_ball)
+                        if ball:
+                            ball.position.x = ball.position.x + reset_vector
+                            ball.velocity.x = 0
+                            ball.velocity.y = 0
+                    for contact_player_id in player.in_contact_player_ids:
+                        contact_player = players[contact_player_id]
+                        contact_player.position.x = contact_player.position.x + reset_vector
+                    break
+
+    def _get_team_hoop_zones(self) -> dict[int, tuple[float, float, list[tuple[float, float, float]]]]:
+        """
+        Return per team the (min x, max x) of the hoop positions and the (x, y, radius) of each own hoop.
+
+        Hoops do not move during a game, so the zones are cached and only rebuilt
+        when the set of hoops changes (e.g. once the pitch is initialized).
+        """
+        hoops = self.state.hoops
+        if self._team_hoop_zones is None or self._team_hoop_zones_n_hoops != len(hoops):
+            team_hoops = {}
+            for hoop in hoops.values():
+                team_hoops.setdefault(hoop.team, []).append((hoop.position.x, hoop.position.y, hoop.radius))
+            team_hoop_zones = {}
+            for team, own_hoops in team_hoops.items():
+                hoops_x = [hoop_x for hoop_x, _, _ in own_hoops]
+                team_hoop_zones[team] = (min(hoops_x), max(hoops_x), own_hoops)
+            self._team_hoop_zones = team_hoop_zones
+            self._team_hoop_zones_n_hoops = len(hoops)
+        return self._team_hoop_zones
 
     def _enforce_pitch_boundaries(self) -> None:
         """
@@ -93,45 +130,71 @@ class BoundaryLogic:
         This is called after all position updates to ensure physics doesn't
         push entities out of the play area.
         """        
-        # Check all entities
-        for moving_entity in list(list(self.state.players.values()) + list(self.state.balls.values())):
-            new_position_x = min(max(self.state.boundaries_x[0] + moving_entity.radius, moving_entity.position.x), self.state.boundaries_x[1] - moving_entity.radius)
-            new_position_y = min(max(self.state.boundaries_y[0] + moving_entity.radius, moving_entity.position.y), self.state.boundaries_y[1] - moving_entity.radius)
-            if new_position_x != moving_entity.position.x or new_position_y != moving_entity.position.y:
-                # print('boundary enforcement for entity', moving_entity.id, new_position_x, moving_entity.position.x, new_position_y, moving_entity.position.y)
-                if hasattr(moving_entity, "ball_type"):
-                    # ball
-                    # stop balls at boundary
-                    # self.logger.debug(f"Ball {moving_entity.id} hit boundary at position ({moving_entity.position.x:.2f}, {moving_entity.position.y:.2f})")
-                    moving_entity.velocity.x = 0
-                    moving_entity.velocity.y = 0
-                    if moving_entity.ball_type == BallType.VOLLEYBALL:
-                        if moving_entity.holder_id is None:
-                            # volleyball going out of bounds only if not hold
-                            self._start_inbounding_procedure()
-                if hasattr(moving_entity, "has_ball"):
-                    # player
-                    if moving_entity.has_ball:
-                        ball = self.state.get_ball(moving_entity.has_ball)
-                        if ball.ball_type == BallType.VOLLEYBALL:
-                            # volleyball going out of bounds
-                            self.logger.info("Volleyball going out of bounds at position where player out of bounds")
-                            # Copy position values, don't share the same Vector2 object
-                            ball.position.x = moving_entity.position.x
-                            ball.position.y = moving_entity.position.y
-                            moving_entity.has_ball = None
-                            ball.holder_id = None
-                            self._start_inbounding_procedure()
+        state = self.state
+        players = state.players
+        boundary_x_min, boundary_x_max = state.boundaries_x
+        boundary_y_min, boundary_y_max = state.boundaries_y
+        # Players and balls in two typed loops (players first, as before), no per-entity type checks
+        for player in players.values():
+            radius = player.radius
+            position = player.position
+            position_x = position.x
+            position_y = position.y
+            min_x = boundary_x_min + radius
+            max_x = boundary_x_max - radius
+            min_y = boundary_y_min + radius
+            max_y = boundary_y_max - radius
+            # fast path: almost every entity is inside the pitch every frame, only the others reach the clamp below
+            if min_x <= position_x <= max_x and min_y <= position_y <= max_y:
+                continue
+            # clamp with conditional expressions instead of min/max builtin calls
+            new_position_x = min_x if position_x < min_x else (max_x if position_x > max_x else position_x)
+            new_position_y = min_y if position_y < min_y else (max_y if position_y > max_y else position_y)
+            if new_position_x != position_x or new_position_y != position_y:
+                # print('boundary enforcement for entity', player.id, new_position_x, player.position.x, new_position_y, player.position.y)
+                if player.has_ball:
+                    ball = state.get_ball(player.has_ball)
+                    if ball.ball_type == BallType.VOLLEYBALL:
+                        # volleyball going out of bounds
+                        self.logger.info("Volleyball going out of bounds at position where player out of bounds")
+                        # Copy position values, don't share the same Vector2 object
+                        ball.position.x = player.position.x
+                        ball.position.y = player.position.y
+                        player.has_ball = None
+                        ball.holder_id = None
+                        self._start_inbounding_procedure()
 
-                    for contact_player_id in moving_entity.in_contact_player_ids:
-                        reset_vector = Vector2(0, 0)
-                        reset_vector.x = new_position_x - moving_entity.position.x
-                        reset_vector.y = new_position_y - moving_entity.position.y
-                        contact_player = self.state.players[contact_player_id]
-                        contact_player.position.x += reset_vector.x
-                        contact_player.position.y += reset_vector.y
-                moving_entity.position.x = new_position_x
-                moving_entity.position.y = new_position_y
+                reset_x = new_position_x - position.x
+                reset_y = new_position_y - position.y
+                for contact_player_id in player.in_contact_player_ids:
+                    players[contact_player_id].position.iadd(reset_x, reset_y)
+                position.x = new_position_x
+                position.y = new_position_y
+
+        for ball in state.balls.values():
+            radius = ball.radius
+            position = ball.position
+            position_x = position.x
+            position_y = position.y
+            min_x = boundary_x_min + radius
+            max_x = boundary_x_max - radius
+            min_y = boundary_y_min + radius
+            max_y = boundary_y_max - radius
+            if min_x <= position_x <= max_x and min_y <= position_y <= max_y:
+                continue
+            new_position_x = min_x if position_x < min_x else (max_x if position_x > max_x else position_x)
+            new_position_y = min_y if position_y < min_y else (max_y if position_y > max_y else position_y)
+            if new_position_x != position_x or new_position_y != position_y:
+                # stop balls at boundary
+                # self.logger.debug(f"Ball {ball.id} hit boundary at position ({ball.position.x:.2f}, {ball.position.y:.2f})")
+                ball.velocity.x = 0
+                ball.velocity.y = 0
+                if ball.ball_type == BallType.VOLLEYBALL:
+                    if ball.holder_id is None:
+                        # volleyball going out of bounds only if not hold
+                        self._start_inbounding_procedure()
+                position.x = new_position_x
+                position.y = new_position_y
 
     
     def _start_inbounding_procedure(self):
@@ -167,19 +230,27 @@ class BoundaryLogic:
                 keeper.dodgeball_immunity = True
             return
         # for other_id, distance in self._get_sorted_distances(volleyball.id).items():
+        # the sorted ball-player row is the neighbourhood query: nearest first, first eligible player wins
+        players = self.state.players
+        possession_team = volleyball.possession_team
+        chaser_role = PlayerRole.CHASER
+        keeper_role = PlayerRole.KEEPER
         for other_id, distance in self.state.squared_distances_ball_player.get(volleyball.id, []):
-            player = self.state.players[other_id]
-            if player.team != volleyball.possession_team: # inbounding player other team
-                if player.role == PlayerRole.CHASER or player.role == PlayerRole.KEEPER:
-                    if player.inbounding is None:
-                        if not player.has_ball:
-                            if not player.is_knocked_out: # what happens if all chasers/keeper of team are knocked out?
-                                self.logger.info("Inbounding procedure started by player %s for volleyball %s", player.id, volleyball.id)
-                                player.inbounding = volleyball.id
-                                player.dodgeball_immunity = True # chaser/keeper immune while inbounding
-                                volleyball.inbounder = player.id
-                                volleyball.holder_id = None
-                                break
+            player = players[other_id]
+            role = player.role
+            # inbounding player of the other team, only chasers/keepers not already inbounding, holding a ball or knocked out
+            # (enum members compared by identity, cheaper than a set membership test which hashes the enum in Python)
+            if (player.team != possession_team
+                    and (role is chaser_role or role is keeper_role)
+                    and player.inbounding is None
+                    and not player.has_ball
+                    and not player.is_knocked_out): # what happens if all chasers/keeper of team are knocked out?
+                self.logger.info("Inbounding procedure started by player %s for volleyball %s", player.id, volleyball.id)
+                player.inbounding = volleyball.id
+                player.dodgeball_immunity = True # chaser/keeper immune while inbounding
+                volleyball.inbounder = player.id
+                volleyball.holder_id = None
+                break
 
     def _inbounding_free_way(self, dt: float) -> None:
         """
@@ -211,14 +282,22 @@ class BoundaryLogic:
         # Track players that need to be moved and their movement vectors
         players_to_move = {}
         normals_players_to_move = {}
+        players = self.state.players
+        get_player = players.get
+        free_way_squared_distances = self._get_free_way_squared_distances()
+        # half of the frame time for the perpendicular deadlock step, same for every pair
+        half_dt = dt * 0.5
         
         # Check players too close to inbounding player
         # for other_id, distance in self._get_sorted_distances(inbounding_player.id).items():
+        # player-player rows only hold player ids, the player is resolved only once within the free way distance.
+        # Rows are from the last distance calculation: a player removed since then has no free way distance,
+        # the inf default sends it to the lookup below, which skips it instead of ending the loop
         for other_id, distance in self.state.squared_distances_player_player.get(inbounding_player.id, []):
-            other_player = self.state.players.get(other_id)
-            if other_player is None:
-                continue
-            if distance < (4 * (other_player.radius)) ** 2:
+            if distance < free_way_squared_distances.get(other_id, math.inf):
+                other_player = get_player(other_id)
+                if other_player is None:
+                    continue
                 move_away_speed = other_player.max_speed
                 move_vector, normal = self._calculate_move_away_vector(inbounding_player, other_player, dt, move_away_speed)
                 if move_vector is not None:
@@ -231,38 +310,40 @@ class BoundaryLogic:
         # for other_id, distance in self._get_sorted_distances(volleyball.id).items():
         for other_id, distance in self.state.squared_distances_ball_player.get(volleyball.id, []):
             if other_id != inbounding_player.id:
-                other_player = self.state.players[other_id]
-                if distance < (4 * (other_player.radius)) ** 2:
+                if distance < free_way_squared_distances.get(other_id, math.inf):
+                    other_player = get_player(other_id)
+                    if other_player is None:
+                        continue # removed since the distance calculation
                     # Only move away from volleyball if not already moving away from inbounding player
                     move_away_speed = other_player.max_speed
                     move_vector, normal = self._calculate_move_away_vector(volleyball, other_player, dt, move_away_speed)
                     if move_vector is not None:
-                        if players_to_move.get(other_id) is not None:
-                            move_vector_existing = players_to_move[other_id]
+                        move_vector_existing = players_to_move.get(other_id)
+                        if move_vector_existing is not None:
                             normal_existing = normals_players_to_move[other_id]
                             # if normals in opposite direction, add smell perpendicular vector to avoid deadlock
-                            similar_orientation = (normal.x * normal_existing.y - normal.y * normal_existing.x)**2 < 0.15
-                            opposite_direction = (normal.x * normal_existing.x + normal.y * normal_existing.y) < 0
-                            # print((normal.x * normal_existing.y - normal.y * normal_existing.x)**2)
-                            # print('normals:', normal.x, normal.y, normal_existing.x, normal_existing.y)
-                            # print(similar_orientation, opposite_direction)
-                            if similar_orientation and opposite_direction: # same direction
-                                # add small perpendicular vector with random direction to previous move vector
-                                sign = random.choice([-1, 1])
-                                move_vector.x = move_vector_existing.x + sign * normal_existing.y * move_away_speed * dt * 0.5
-                                move_vector.y = move_vector_existing.y + sign * -normal_existing.x * move_away_speed * dt * 0.5
+                            # cross (orientation) and dot (direction) of both unit normals computed once on locals
+                            normal_x = normal.x
+                            normal_y = normal.y
+                            normal_existing_x = normal_existing.x
+                            normal_existing_y = normal_existing.y
+                            cross = normal_x * normal_existing_y - normal_y * normal_existing_x
+                            # print(cross * cross)
+                            # print('normals:', normal_x, normal_y, normal_existing_x, normal_existing_y)
+                            if cross * cross < 0.15 and normal_x * normal_existing_x + normal_y * normal_existing_y < 0: # similar orientation but opposite direction
+                                # add small perpendicular vector with random direction to previous move vector in place
+                                perpendicular_step = random.choice(PERPENDICULAR_SIGNS) * move_away_speed * half_dt
+                                move_vector_existing.x += perpendicular_step * normal_existing_y
+                                move_vector_existing.y -= perpendicular_step * normal_existing_x
                                 self.logger.debug("Added perpendicular vector to avoid deadlock for player %s during inbounding free way", other_id)
-                            else:
-                                continue
-                        players_to_move[other_id]= move_vector
+                        else:
+                            players_to_move[other_id] = move_vector
                 else:
                     break
         
         # Apply all movements
         for player_id, move_vector in players_to_move.items():
-            player = self.state.players[player_id]
-            player.position.x += move_vector.x
-            player.position.y += move_vector.y
+            players[player_id].position.iadd(move_vector.x, move_vector.y)
 
     def _making_alive_keeper_free_way(self, dt: float) -> None:
         """
@@ -279,30 +360,50 @@ class BoundaryLogic:
             return
         if not volleyball.is_dead:
             return  # Volleyball not dead, no free way needed
-        keeper = None
-        players = self.state.players.values()
-        for player in players:
-            if player.role == PlayerRole.KEEPER and player.team == volleyball.possession_team:
-                keeper = player
-                break
+        # keeper of the possession team from the per team keeper references instead of scanning all players
+        possession_team = volleyball.possession_team
+        if possession_team == self.state.team_0:
+            keeper = self.state.keeper_team_0
+        elif possession_team == self.state.team_1:
+            keeper = self.state.keeper_team_1
+        else:
+            keeper = None
         if keeper is None:
             return
         # Check players too close to keeper
         # for other_id, distance in self._get_sorted_distances(keeper.id).items():
+        get_player = self.state.players.get
+        free_way_squared_distances = self._get_free_way_squared_distances()
+        # stale rows of removed players are skipped like in _inbounding_free_way
         for other_id, distance in self.state.squared_distances_player_player.get(keeper.id, []):
-            other_player = self.state.players.get(other_id)
-            if other_player is None:
-                continue
-            if distance < (4 * (other_player.radius)) ** 2:
+            if distance < free_way_squared_distances.get(other_id, math.inf):
+                other_player = get_player(other_id)
+                if other_player is None:
+                    continue
                 move_away_speed = other_player.max_speed
                 move_vector, normal = self._calculate_move_away_vector(keeper, other_player, dt, move_away_speed)
                 if move_vector is not None:
-                    other_player.position.x += move_vector.x
-                    other_player.position.y += move_vector.y
+                    other_player.position.iadd(move_vector.x, move_vector.y)
             else:
                 break
         
 
+    def _get_free_way_squared_distances(self) -> dict[str, float]:
+        """
+        Return the squared free way distance (4 player radii) per player id.
+
+        Player radii are set when a player is created and do not change during a game,
+        so the values are cached and only rebuilt when the set of player ids changes.
+        """
+        players = self.state.players
+        if self._free_way_squared_distances is None or self._free_way_squared_distances.keys() != players.keys():
+            free_way_squared_distances = {}
+            for player_id, player in players.items():
+                free_way_distance = 4 * player.radius
+                free_way_squared_distances[player_id] = free_way_distance * free_way_distance
+            self._free_way_squared_distances = free_way_squared_distances
+        return self._free_way_squared_distances
+
     def _calculate_move_away_vector(self, move_free_entity, move_away_entity, dt: float, move_away_speed: float) -> Optional[tuple[Vector2, Vector2]]:
         """
         Calculate the movement vector to move an entity away from another entity.
@@ -325,36 +426,32 @@ class BoundaryLogic:
                 - normal: The unit normal from fixed entity to moving entity
             Returns None if entities are at same position (division by zero)
         """
-        # push player away from the entity
-        normal = Vector2(
-            move_away_entity.position.x - move_free_entity.position.x,
-            move_away_entity.position.y - move_free_entity.position.y
-        )
-        normal_mag = UtilityLogic._magnitude(normal)
-        if normal_mag == 0:
+        # push player away from the entity, on plain floats until the returned vectors
+        normal_x = move_away_entity.position.x - move_free_entity.position.x
+        normal_y = move_away_entity.position.y - move_free_entity.position.y
+        normal_mag_sq = normal_x * normal_x + normal_y * normal_y
+        if normal_mag_sq == 0:
             self.logger.warning("Zero normal magnitude in inbounding free way (entities at same position)")
             return None
-        normal.x /= normal_mag
-        normal.y /= normal_mag
+        inv_normal_mag = 1.0 / math.sqrt(normal_mag_sq)
+        normal_x *= inv_normal_mag
+        normal_y *= inv_normal_mag
         # take into account the other player's velocity and movement this frame so no "unnatural movement" occurs
-        dot_other = move_away_entity.velocity.x * normal.x + move_away_entity.velocity.y * normal.y
-        other_velocity_along_normal = Vector2(normal.x * dot_other, normal.y * dot_other)
-        other_velocity_perpendicular = Vector2(
-            move_away_entity.velocity.x - other_velocity_along_normal.x,
-            move_away_entity.velocity.y - other_velocity_along_normal.y
-        )
-        move_away_entity.velocity.x = other_velocity_perpendicular.x
-        move_away_entity.velocity.y = other_velocity_perpendicular.y
+        velocity = move_away_entity.velocity
+        dot_other = velocity.x * normal_x + velocity.y * normal_y
+        other_velocity_along_normal_x = normal_x * dot_other
+        other_velocity_along_normal_y = normal_y * dot_other
+        # keep only the perpendicular velocity component
+        velocity.x -= other_velocity_along_normal_x
+        velocity.y -= other_velocity_along_normal_y
         # add small jitter factor to avoid deadlocks between several _inbounding_free_way calls
-        jitter_factor_x = random.uniform(0.95, 1.05) # radians
-        jitter_factor_y = random.uniform(0.95, 1.05)
-        move_away_vector = Vector2(
-            (normal.x * move_away_speed - other_velocity_along_normal.x) * jitter_factor_x,
-            (normal.y * move_away_speed - other_velocity_along_normal.y) * jitter_factor_y
-        )
-        # self.logger.debug("Calculated move away vector (%s, %s) for player %s to move away from entity %s during inbounding free way", move_away_vector.x, move_away_vector.y, move_away_entity.id, move_free_entity.id)
-        # self.logger.debug("other velocity along normal: (%s, %s), other velocity perpendicular: (%s, %s)", other_velocity_along_normal.x, other_velocity_along_normal.y, other_velocity_perpendicular.x, other_velocity_perpendicular.y)
-        return Vector2(move_away_vector.x * dt, move_away_vector.y * dt), normal
+        random_value = random.random
+        jitter_factor_x = JITTER_MIN + JITTER_SPAN * random_value() # radians
+        jitter_factor_y = JITTER_MIN + JITTER_SPAN * random_value()
+        move_away_x = (normal_x * move_away_speed - other_velocity_along_normal_x) * jitter_factor_x
+        move_away_y = (normal_y * move_away_speed - other_velocity_along_normal_y) * jitter_factor_y
+        # self.logger.debug("Calculated move away vector (%s, %s) for player %s to move away from entity %s during inbounding free way", move_away_x, move_away_y, move_away_entity.id, move_free_entity.id)
+        return Vector2(move_away_x * dt, move_away_y * dt), Vector2(normal_x, normal_y)
 
     # def _move_away(self, move_free_entity, move_away_entity, dt: float, move_away_speed: float) -> None:
     #     """
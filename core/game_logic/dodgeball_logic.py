@@ -1,6 +1,7 @@
 import logging
+import math
 from core.game_state import GameState
-from core.entities import Player, Ball, VolleyBall, DodgeBall, Vector2, PlayerRole, BallType
+from core.entities import Player, Ball, VolleyBall, DodgeBall, PlayerRole, BallType
 
 BASE_LOGGER = logging.getLogger('quadball.game_logic')
 
@@ -41,23 +42,23 @@ class DodgeballLogic:
         Returns:
             True if pickup was successful, False otherwise
         """
-        if player.catch_cooldown <= 0.0:
-            if player.role == PlayerRole.BEATER:
-                if not player.has_ball:
-                    if self.state.third_dodgeball == dodgeball.id and self.state.third_dodgeball_team != player.team:
-                        # third dodgeball and player in already dodgeball possesing team
-                        self.penalty_logic._third_dodgeball_interference(player, dodgeball)
-                    else:
-                    # Player picks up dodgeball
-                        dodgeball.holder_id = player.id
-                        dodgeball.possession_team = player.team
-                        player.has_ball = dodgeball.id
-                        if dodgeball.turnover_to_player is not None:
-                            dodgeball.turnover_to_player = None
-                            player.is_receiving_turnover_ball = False
-                        self.logger.info("Player %s picked up dodgeball %s", player.id, dodgeball.id)
-                    return True
-        return False
+        # only a beater without a ball and with expired catch cooldown can pick up a dodgeball
+        if player.catch_cooldown > 0.0 or player.role is not PlayerRole.BEATER or player.has_ball:
+            return False
+        state = self.state
+        if state.third_dodgeball == dodgeball.id and state.third_dodgeball_team != player.team:
+            # third dodgeball and player in already dodgeball possesing team
+            self.penalty_logic._third_dodgeball_interference(player, dodgeball)
+        else:
+            # Player picks up dodgeball
+            dodgeball.holder_id = player.id
+            dodgeball.possession_team = player.team
+            player.has_ball = dodgeball.id
+            if dodgeball.turnover_to_player is not None:
+                dodgeball.turnover_to_player = None
+                player.is_receiving_turnover_ball = False
+            self.logger.info("Player %s picked up dodgeball %s", player.id, dodgeball.id)
+        return True
 
     def _check_dodgeball_interactions(self) -> None:
         """
@@ -73,38 +74,53 @@ class DodgeballLogic:
         dodgeballs = self.state.dodgeballs
         if len(dodgeballs) == 0:
             return  # No dodgeballs exist
+        max_player_radius = self.state.max_player_radius
+        # ball-player lists only hold player ids, resolve them with one bound dict lookup each
+        get_player = self.state.players.get
+        squared_distances_ball_player = self.state.squared_distances_ball_player
+        # frame invariants hoisted out of the per pair loop, roles compared by identity
+        seeker_on_pitch = self.state.seeker_on_pitch
+        seeker_role = PlayerRole.SEEKER
+        beater_role = PlayerRole.BEATER
         for dodgeball in dodgeballs:
+            dodgeball_radius = dodgeball.radius
             # Distances are sorted ascending; once above this threshold no player can interact.
-            max_interaction_dist_sq = (dodgeball.radius + self.state.max_player_radius) ** 2
+            # A single contact miss below it must not break, a further player can have a larger radius.
+            max_interaction_dist = dodgeball_radius + max_player_radius
+            max_interaction_dist_sq = max_interaction_dist * max_interaction_dist
+            # only changed by a pickup, which ends this dodgeball's loop (possession_team can change in beat checks, so it is re-read)
+            turnover_to_player = dodgeball.turnover_to_player
             # for other_id, distance in self._get_sorted_distances(dodgeball.id).items():
-            for other_id, distance in self.state.squared_distances_ball_player.get(dodgeball.id, []):
+            for other_id, distance in squared_distances_ball_player.get(dodgeball.id, []):
                 if distance > max_interaction_dist_sq:
                     break
-                player = self.state.players.get(other_id)
+                player = get_player(other_id)
                 if player is None:
                     continue
-                if player.role == PlayerRole.SEEKER and not self.state.seeker_on_pitch:
+                role = player.role
+                if role is seeker_role and not seeker_on_pitch:
                     continue  # skip seeker-dodgeball interactions when seekers are not on pitch
                 if not player.is_knocked_out:
-                    if distance < (player.radius + dodgeball.radius) ** 2:
-                        if dodgeball.turnover_to_player is not None and dodgeball.turnover_to_player != player.id:
+                    contact_dist = player.radius + dodgeball_radius
+                    if distance < contact_dist * contact_dist:
+                        if turnover_to_player is not None and turnover_to_player != player.id:
                             continue # dodgeball in turnover can only be picked up by designated player
                         else:
                             # check if loose dead dodgeball or beater of same team
                             if dodgeball.possession_team is None or (
-                                dodgeball.possession_team == player.team and player.role == PlayerRole.BEATER
+                                dodgeball.possession_team == player.team and role is beater_role
                                 ) or (
-                                dodgeball.turnover_to_player is not None and dodgeball.possession_team != player.team and player.is_receiving_turnover_ball
+                                turnover_to_player is not None and dodgeball.possession_team != player.team and player.is_receiving_turnover_ball
                                 ): # ball pickup with dead dodgeball or beater own team or ball in turnover to other team
                                 if self._check_dodgeball_possession_of_player(player, dodgeball):
                                     break
                             else: # beat checks
-                                self._check_beats(player, dodgeball, dodgeballs)
+                                self._check_beats(player, dodgeball, dodgeballs, distance)
                                 # if self._check_beats(player, dodgeball):
                                     # break only one beat allowed?
 
 
-    def _check_beats(self, player: Player, dodgeball: Ball, dodgeballs: list) -> bool:
+    def _check_beats(self, player: Player, dodgeball: Ball, dodgeballs: list, squared_distance: float | None = None) -> bool:
         """
         Check if a dodgeball hits (beats) a player and handle the knockout.
         
@@ -126,6 +142,9 @@ class DodgeballLogic:
         Args:
             player: The player that might be hit
             dodgeball: The dodgeball that might hit the player
+            dodgeballs: All dodgeballs, their beat attempt times are reset on a knockout
+            squared_distance: Precomputed squared distance between dodgeball and player,
+                reused for the reflection normal. Computed from the positions if None.
             
         Returns:
             True if player was knocked out, False otherwise
@@ -137,15 +156,7 @@ class DodgeballLogic:
                 return False # beater still throwing dodgeball
             dodgeball.possession_team = None
             # reflecting dodgeball even by own player
-            normal = Vector2(
-                dodgeball.position.x - player.position.x,
-                dodgeball.position.y - player.position.y
-            )
-            normal_mag = (normal.x**2 + normal.y**2) ** 0.5
-            normal.x /= normal_mag
-            normal.y /= normal_mag
-            # print(f'normal: {normal.x}, {normal.y}, before reflect vel: {dodgeball.velocity.x}, {dodgeball.velocity.y}, after reflect vel: {dodgeball.velocity.reflect(normal, dodgeball.reflect_velocity_loss).x} {dodgeball.velocity.reflect(normal, dodgeball.reflect_velocity_loss).y}')
-            dodgeball.velocity = dodgeball.velocity.reflect(normal, dodgeball.reflect_velocity_loss)
+            self._reflect_dodgeball_off_player(dodgeball, player, squared_distance)
             return False
         else:
             player.is_knocked_out = True
@@ -158,14 +169,7 @@ class DodgeballLogic:
                 self.logger.info("Player %s dropped ball %s due to knockout", player.id, ball.id)
                 player.has_ball = None
             # dodgeball.possession_team = None # Only one beat at once?
-            normal = Vector2(
-                dodgeball.position.x - player.position.x,
-                dodgeball.position.y - player.position.y
-            )
-            normal_mag = (normal.x**2 + normal.y**2) ** 0.5
-            normal.x /= normal_mag
-            normal.y /= normal_mag
-            dodgeball.velocity = dodgeball.velocity.reflect(normal, dodgeball.reflect_velocity_loss)
+            self._reflect_dodgeball_off_player(dodgeball, player, squared_distance)
             self.logger.info("Player %s was knocked out by dodgeball %s", player.id, dodgeball.id)
             for dodgeball in dodgeballs:
                 dodgeball.beat_attempt_time = 0.0 # reset beat attempt time
@@ -175,6 +179,28 @@ class DodgeballLogic:
             return True
         
 
+    @staticmethod
+    def _reflect_dodgeball_off_player(dodgeball: Ball, player: Player, squared_distance: float | None = None) -> None:
+        """
+        Reflect the dodgeball velocity in place at the normal from the player to the dodgeball.
+
+        Same as Vector2.reflect with the dodgeball's reflect_velocity_loss, but on scalars
+        and written into the existing velocity so no Vector2 is allocated per beat.
+        The squared distance of the interaction row can be passed in, it equals the squared normal magnitude.
+        """
+        normal_x = dodgeball.position.x - player.position.x
+        normal_y = dodgeball.position.y - player.position.y
+        if squared_distance is None:
+            squared_distance = normal_x * normal_x + normal_y * normal_y
+        inv_normal_mag = 1.0 / math.sqrt(squared_distance)
+        normal_x *= inv_normal_mag
+        normal_y *= inv_normal_mag
+        velocity = dodgeball.velocity
+        dot_product = velocity.x * normal_x + velocity.y * normal_y
+        keep_factor = 1 - dodgeball.reflect_velocity_loss
+        velocity.x = (velocity.x - 2 * dot_product * normal_x) * keep_factor
+        velocity.y = (velocity.y - 2 * dot_product * normal_y) * keep_factor
+
     # def _check_ball_collisions(self) -> None:
     #     """Check if players can pick up nearby balls."""
 
@@ -183,25 +209,74 @@ class DodgeballLogic:
     #                         # Ignore ball-ball collisions for now
     #                         continue
 
-    def _is_dodgeball_third(self, dodgeballs_per_team) -> bool:
+    def _is_dodgeball_third(self, n_dead_dodgeballs: int, n_held_team_0: int, n_held_team_1: int) -> bool:
         """
         Determine whether the free dodgeball becomes a third-dodgeball.
 
         Args:
-            dodgeballs_per_team: Precomputed mapping of dodgeball ownership states.
+            n_dead_dodgeballs: Number of dodgeballs without possession team.
+            n_held_team_0: Number of dodgeballs held by players of team 0.
+            n_held_team_1: Number of dodgeballs held by players of team 1.
 
         Returns:
             True if a third-dodgeball situation exists, False otherwise.
         """
-        if len(dodgeballs_per_team['dead_dodgeballs']) == 1:
-            if len(dodgeballs_per_team[f'hold_dodgeballs_{self.state.team_0}']) == 2 and len(dodgeballs_per_team[f'hold_dodgeballs_{self.state.team_1}']) == 0:
+        if n_dead_dodgeballs == 1:
+            if n_held_team_0 == 2 and n_held_team_1 == 0:
                 self.state.third_dodgeball_team = self.state.team_1
                 return True
-            elif len(dodgeballs_per_team[f'hold_dodgeballs_{self.state.team_0}']) == 0 and len(dodgeballs_per_team[f'hold_dodgeballs_{self.state.team_1}']) == 2:
+            elif n_held_team_0 == 0 and n_held_team_1 == 2:
                 self.state.third_dodgeball_team = self.state.team_0
                 return True
         return False
 
+    def _is_still_third_dodgeball(self, n_held_per_team: list[int], thrown_dodgeballs_per_team: list[list], dt: float) -> bool:
+        """
+        Determine whether the current third-dodgeball situation still exists.
+
+        Also starts the beat attempt time of dodgeballs thrown by the team holding the other two.
+
+        Args:
+            n_held_per_team: Number of dodgeballs held by players, indexed by team.
+            thrown_dodgeballs_per_team: Thrown dodgeballs still in possession, indexed by team.
+            dt: Delta game time since last frame in seconds.
+
+        Returns:
+            True if the third-dodgeball situation still exists, False otherwise.
+        """
+        team_0 = self.state.team_0
+        team_1 = self.state.team_1
+        third_dodgeball_team = self.state.third_dodgeball_team
+        if n_held_per_team[third_dodgeball_team] + len(thrown_dodgeballs_per_team[third_dodgeball_team]) > 0:
+            # team without dodgeball got one
+            return False
+        else:
+            if third_dodgeball_team == team_0:
+                dodgeball_possessing_team = team_1
+            else:
+                dodgeball_possessing_team = team_0
+            # if n_held_per_team[dodgeball_possessing_team] == 0:
+            #     # not holding dodgeballs anymore. Is it really loosing third dodgeball after rulebook? -> No third dodgeball still exists
+            #     return False
+            # when thrown still possesion
+            for thrown_dodgeball in thrown_dodgeballs_per_team[dodgeball_possessing_team]:
+                if thrown_dodgeball.holder_id is None: # thrown
+                    if thrown_dodgeball.beat_attempt_time == 0.0:
+                        # "initialize" beat_attempt_time
+                        thrown_dodgeball.beat_attempt_time = dt
+                        self.logger.debug("Initiating beat attempt time for dodgeball %s", thrown_dodgeball.id)
+
+            
+                # reasonable beat attempt 
+                # get thrown bludger in dodgeball_team possesion
+                # 
+                #  and check if throw line to certain length close enough to nearest chaser
+                # option 1: check distance throw to chaser positions at throw
+                # option 2: include their current velocity at throw
+                ## favorite option 3: monitor closest distance until beat or velocity below threshold
+                pass
+        return True
+
     def _check_third_dodgeball(self, dt) -> None:
         """
         Enforce the rule that only 2 dodgeballs can be held by one team at once.
@@ -211,40 +286,6 @@ class DodgeballLogic:
         - This prevents one team from accumulating all balls and denying the other team play
         - The assigned possession lasts until a player picks it up or game state changes
         """
-
-        def is_still_third_dodgeball(dodgeballs_per_team):
-            if len(dodgeballs_per_team[f'hold_dodgeballs_{self.state.third_dodgeball_team}'] + dodgeballs_per_team[f'thrown_dodgeballs_{self.state.third_dodgeball_team}']) > 0:
-                # team without dodgeball got one
-                return False
-            else:
-                if self.state.third_dodgeball_team == self.state.team_0:
-                    dodgeball_possessing_team = self.state.team_1
-                else:
-                    dodgeball_possessing_team = self.state.team_0
-                # if len(dodgeballs_per_team[dodgeball_possessing_team]) == 0:
-                #     # not holding dodgeballs anymore. Is it really loosing third dodgeball after rulebook? -> No third dodgeball still exists
-                #     return False
-                # when thrown still possesion
-                thrown_dodgeball_ids = dodgeballs_per_team[f'thrown_dodgeballs_{dodgeball_possessing_team}']
-                for thrown_dodgeball_id in thrown_dodgeball_ids:
-                    thrown_dodgeball = self.state.balls[thrown_dodgeball_id]
-                    if thrown_dodgeball.holder_id is None: # thrown
-                        if thrown_dodgeball.beat_attempt_time == 0.0:
-                            # "initialize" beat_attempt_time
-                            thrown_dodgeball.beat_attempt_time = dt
-                            self.logger.debug("Initiating beat attempt time for dodgeball %s", thrown_dodgeball.id)
-
-                
-                    # reasonable beat attempt 
-                    # get thrown bludger in dodgeball_team possesion
-                    # 
-                    #  and check if throw line to certain length close enough to nearest chaser
-                    # option 1: check distance throw to chaser positions at throw
-                    # option 2: include their current velocity at throw
-                    ## favorite option 3: monitor closest distance until beat or velocity below threshold
-                    pass
-            return True
-
         dodgeballs = self.state.dodgeballs
         # if len(dodgeballs) == 0:
         #     return # no dodgeball exist
@@ -252,13 +293,14 @@ class DodgeballLogic:
         # potential_number_third_dodgeballs = len(dodgeballs) // 2
             
         # check for third dodgeballs
-            dodgeballs_per_team = {
-                f'hold_dodgeballs_{self.state.team_0}': [],
-                f'hold_dodgeballs_{self.state.team_1}': [],
-                f'thrown_dodgeballs_{self.state.team_0}': [],
-                f'thrown_dodgeballs_{self.state.team_1}': [],
-                'dead_dodgeballs': [],
-                }
+            # counters instead of per team id lists, only thrown dodgeballs are needed individually
+            # two slot lists indexed by team (team ids are 0 and 1, like the score list)
+            team_0 = self.state.team_0
+            team_1 = self.state.team_1
+            n_held_per_team = [0, 0]
+            thrown_dodgeballs_per_team = [[], []]
+            n_dead_dodgeballs = 0
+            dead_dodgeball_id = None
             for dodgeball in dodgeballs:
                 if dodgeball.beat_attempt_time > 0:
                     dodgeball.beat_attempt_time += dt
@@ -272,22 +314,24 @@ class DodgeballLogic:
                             dodgeball.beat_attempt_time = 0.0
                             self.penalty_logic._third_dodgeball_interference(player, dodgeball)
                 if dodgeball.possession_team is None:
-                    dodgeballs_per_team['dead_dodgeballs'].append(dodgeball.id)
+                    n_dead_dodgeballs += 1
+                    if dead_dodgeball_id is None:
+                        dead_dodgeball_id = dodgeball.id
                 elif dodgeball.holder_id is not None:
                     holder = self.state.players[dodgeball.holder_id]
-                    dodgeballs_per_team[f'hold_dodgeballs_{holder.team}'].append(dodgeball.id)
+                    n_held_per_team[holder.team] += 1
                 else:
-                    dodgeballs_per_team[f'thrown_dodgeballs_{dodgeball.possession_team}'].append(dodgeball.id)
+                    thrown_dodgeballs_per_team[dodgeball.possession_team].append(dodgeball)
             if self.state.third_dodgeball is None:
-                if self._is_dodgeball_third(dodgeballs_per_team):
-                    third_dodgeball_id = dodgeballs_per_team['dead_dodgeballs'][0]
+                if self._is_dodgeball_third(n_dead_dodgeballs, n_held_per_team[team_0], n_held_per_team[team_1]):
+                    third_dodgeball_id = dead_dodgeball_id
                     # third_dodgeball = self.state.balls[third_dodgeball_id]
                     self.state.third_dodgeball = third_dodgeball_id
                     self.logger.info("Third dodgeball %s assigned to team %s", third_dodgeball_id, self.state.third_dodgeball_team)
             else:
                 # third dodgeball exists
                 # checks if still third dodgeball
-                if not is_still_third_dodgeball(dodgeballs_per_team):
+                if not self._is_still_third_dodgeball(n_held_per_team, thrown_dodgeballs_per_team, dt):
                     self.state.third_dodgeball = None
                     self.state.third_dodgeball_team = None
                     # reset beat attempt times and potential interference
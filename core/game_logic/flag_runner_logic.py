@@ -1,4 +1,5 @@
 import logging
+import math
 import random
 from core.game_state import GameState
 from core.entities import Player, FlagRunner, PlayerRole, Vector2
@@ -65,9 +66,14 @@ class FlagRunnerLogic:
                             seeker_avoid_direction.y += (flag_runner.position.y - next_player_position.y) * avoidance_strength
 
         # Avoid boundaries of the pitch
+        # squared boundary distances by multiplication, ** goes through the generic power path
         boundary_epsilon = flag_runner.boundary_epsilon
-        x_avoidance = 1 / ((flag_runner.position.x - self.state.boundaries_x[0])**2 + boundary_epsilon) - 1 / ((flag_runner.position.x - self.state.boundaries_x[1])**2 + boundary_epsilon)
-        y_avoidance = 1 / ((flag_runner.position.y - self.state.boundaries_y[0])**2 + boundary_epsilon) - 1 / ((flag_runner.position.y - self.state.boundaries_y[1])**2 + boundary_epsilon)
+        distance_x_min = flag_runner.position.x - self.state.boundaries_x[0]
+        distance_x_max = flag_runner.position.x - self.state.boundaries_x[1]
+        distance_y_min = flag_runner.position.y - self.state.boundaries_y[0]
+        distance_y_max = flag_runner.position.y - self.state.boundaries_y[1]
+        x_avoidance = 1 / (distance_x_min * distance_x_min + boundary_epsilon) - 1 / (distance_x_max * distance_x_max + boundary_epsilon)
+        y_avoidance = 1 / (distance_y_min * distance_y_min + boundary_epsilon) - 1 / (distance_y_max * distance_y_max + boundary_epsilon)
         seeker_avoid_boundary_direction = Vector2(x_avoidance * flag_runner.boundary_avoidance_factor, y_avoidance * flag_runner.boundary_avoidance_factor)
 
         flag_runner.direction.x = random_x_direction + midline_x_direction + seeker_avoid_direction.x + seeker_avoid_boundary_direction.x
@@ -83,23 +89,39 @@ class FlagRunnerLogic:
         if not self.state.flag_runner_on_pitch:
             return
         flag_runner = self.state.flag_runner
-        mag_dir = UtilityLogic._magnitude(flag_runner.direction)
+        # same step as BasicLogic.update_player_velocity, on locals read and written back once
+        direction = flag_runner.direction
+        velocity = flag_runner.velocity
+        direction_x = direction.x
+        direction_y = direction.y
+        mag_dir = math.hypot(direction_x, direction_y)
         if mag_dir > 1:
-            flag_runner.direction.x = flag_runner.direction.x / mag_dir
-            flag_runner.direction.y = flag_runner.direction.y / mag_dir
+            inv_mag_dir = 1.0 / mag_dir
+            direction_x *= inv_mag_dir
+            direction_y *= inv_mag_dir
+            direction.x = direction_x
+            direction.y = direction_y
         elif mag_dir < flag_runner.min_dir:
-            flag_runner.direction.x = 0
-            flag_runner.direction.y = 0
-        flag_runner.velocity.x = flag_runner.velocity.x + ( - flag_runner.deacceleration_rate * flag_runner.velocity.x + flag_runner.direction.x * flag_runner.acceleration) * dt
-        flag_runner.velocity.y = flag_runner.velocity.y + ( - flag_runner.deacceleration_rate * flag_runner.velocity.y + flag_runner.direction.y * flag_runner.acceleration) * dt
-        speed = UtilityLogic._magnitude(flag_runner.velocity)
+            direction_x = 0
+            direction_y = 0
+            direction.x = 0
+            direction.y = 0
+        deacceleration_rate = flag_runner.deacceleration_rate
+        acceleration = flag_runner.acceleration
+        velocity_x = velocity.x
+        velocity_y = velocity.y
+        velocity_x = velocity_x + ( - deacceleration_rate * velocity_x + direction_x * acceleration) * dt
+        velocity_y = velocity_y + ( - deacceleration_rate * velocity_y + direction_y * acceleration) * dt
+        speed = math.hypot(velocity_x, velocity_y)
         if speed > flag_runner.max_speed:
             scale = flag_runner.max_speed / speed
-            flag_runner.velocity.x = flag_runner.velocity.x * scale
-            flag_runner.velocity.y = flag_runner.velocity.y * scale
+            velocity_x = velocity_x * scale
+            velocity_y = velocity_y * scale
         elif (speed < flag_runner.min_speed) and (mag_dir < flag_runner.min_dir):
-            flag_runner.velocity.x = 0
-            flag_runner.velocity.y = 0
+            velocity_x = 0
+            velocity_y = 0
+        velocity.x = velocity_x
+        velocity.y = velocity_y
 
     def update_flag_runner_position(self, dt: float) -> None:
         """
@@ -137,7 +159,8 @@ class FlagRunnerLogic:
                 continue
 
             squared_distance = UtilityLogic._squared_distance(seeker.position, flag_runner.position)
-            collision_dist_sq = (seeker.radius + flag_runner.radius) ** 2
+            collision_dist = seeker.radius + flag_runner.radius
+            collision_dist_sq = collision_dist * collision_dist
             if squared_distance < collision_dist_sq:
                 # Collision occurred
                 UtilityLogic._resolve_elastic_entity_collisions(seeker, flag_runner)
@@ -147,10 +170,10 @@ class FlagRunnerLogic:
                 seeker.flag_runner_interaction_time = 0.0  # reset if not in contact
             if seeker.flag_runner_interaction_time > flag_runner.interaction_time_threshold:
                 # seeker has been in contact with the flag runner for long enough to "catch" it
-                self.logger.info(f'Seeker {seeker.id} starts a catch attempt trial after {seeker.flag_runner_interaction_time:.2f} seconds of contact.')
+                self.logger.info("Seeker %s starts a catch attempt trial after %.2f seconds of contact.", seeker.id, seeker.flag_runner_interaction_time)
                 # sample random number to determine if the seeker catches the flag runner
                 if random.random() < flag_runner.catch_probability:
-                    self.logger.info(f'Seeker {seeker.id} successfully caught the flag runner after {seeker.flag_runner_interaction_time:.2f} seconds of contact.')
+                    self.logger.info("Seeker %s successfully caught the flag runner after %.2f seconds of contact.", seeker.id, seeker.flag_runner_interaction_time)
                     self.resolve_catch(seeker, flag_runner)
                 seeker.flag_runner_interaction_time = 0.0
 
@@ -114,45 +114,58 @@ class GameLogic:
         Args:
             dt: Delta game time in seconds since last frame
         """
-        if self.state.is_game_active:
+        state = self.state
+        if state.is_game_active:
+            # subsystems bound once per frame; methods are still looked up on them so step profiling wrappers apply
+            basic_logic = self.basic_logic
+            boundary_logic = self.boundary_logic
+            flag_runner_logic = self.flag_runner_logic
+            physical_contact_logic = self.physical_contact_logic
+            volleyball_logic = self.volleyball_logic
+            dodgeball_logic = self.dodgeball_logic
             # Update game time
-            self.state.update_game_time(dt)
-            self.flag_runner_logic.update_flag_runner_direction(dt)
-            self.flag_runner_logic.update_flag_runner_velocity(dt)
-            self.basic_logic.update_player_velocities(dt)
+            state.update_game_time(dt)
+            flag_runner_logic.update_flag_runner_direction(dt)
+            flag_runner_logic.update_flag_runner_velocity(dt)
+            basic_logic.update_player_velocities(dt)
 
-            self.flag_runner_logic._check_seeker_flag_runner_interaction(dt)
+            flag_runner_logic._check_seeker_flag_runner_interaction(dt)
 
             # Check player collisions and enforce tackle effects before updating positions and after updating player velocities
-            self.physical_contact_logic._check_player_collisions()
+            physical_contact_logic._check_player_collisions()
             # after collisions before updating positions so setting velocity to 0 when tackling takes effect before position updates and after velocity updates
-            self.physical_contact_logic._enforce_tackle()
+            physical_contact_logic._enforce_tackle()
 
-            self.basic_logic.update_ball_velocities(dt)
+            basic_logic.update_ball_velocities(dt)
             
             # Update player, ball and flag runner positions
-            self.flag_runner_logic.update_flag_runner_position(dt)
-            self.basic_logic.update_positions(dt)
-            self.basic_logic.check_keeper_special_powers() # e.g. dodgeball immunity, protected keeper
-            # free way for volleyball inbounder
-            self.boundary_logic._inbounding_free_way(dt)
-            self.boundary_logic._making_alive_keeper_free_way(dt)
-            self.boundary_logic._enforce_hoop_blockage() # after update positions because possibly resetting to previous position
-            self.volleyball_logic.make_volleyball_alive()
+            flag_runner_logic.update_flag_runner_position(dt)
+            basic_logic.update_positions(dt)
+            basic_logic.check_keeper_special_powers() # e.g. dodgeball immunity, protected keeper
+            # free way for volleyball inbounder, only entered while the volleyball needs one
+            # (guards read from the volleyball itself, so they cannot drift out of sync with it)
+            volleyball = state.volleyball
+            if volleyball:
+                if volleyball.inbounder is not None:
+                    boundary_logic._inbounding_free_way(dt)
+                if volleyball.is_dead:
+                    boundary_logic._making_alive_keeper_free_way(dt)
+            boundary_logic._enforce_hoop_blockage() # after update positions because possibly resetting to previous position
+            volleyball_logic.make_volleyball_alive()
             
             self.utility_logic._calculate_distances()
-            self.basic_logic._check_ball_collisions() # after distance calculation
+            basic_logic._check_ball_collisions() # after distance calculation
 
-            self.volleyball_logic._check_volleyball_possessions()
-            self.dodgeball_logic._check_dodgeball_interactions()
+            volleyball_logic._check_volleyball_possessions()
+            dodgeball_logic._check_dodgeball_interactions()
 
-            self.volleyball_logic._check_goals()
+            volleyball_logic._check_goals()
 
-            self.dodgeball_logic._check_third_dodgeball(dt)
+            dodgeball_logic._check_third_dodgeball(dt)
             self.penalty_logic._check_delay_of_game(dt)
             
             # Check pitch boundaries
-            self.boundary_logic._enforce_pitch_boundaries() # at least after free ways and position updates
+            boundary_logic._enforce_pitch_boundaries() # at least after free ways and position updates
 
     def copy(self, log_level = None) -> 'GameLogic':
         """Return a new GameLogic instance with a copied GameState.
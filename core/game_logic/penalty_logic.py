@@ -53,29 +53,42 @@ class PenaltyLogic:
                 return None # volleyball in turnover cannot incur delay of game
             if volleyball.possession_team is None:
                 return None # So far unpossessed volleyball cannot incur delay of game
-            if volleyball.possession_team == self.state.team_0:
-                delay_velocity = self.state.delay_of_game_velocity_x_threshold - volleyball.velocity.x
+            # state values bound once, the player loop below compares against them per player
+            state = self.state
+            possession_team = volleyball.possession_team
+            midline_x = state.midline_x
+            if possession_team == state.team_0:
+                delay_velocity = state.delay_of_game_velocity_x_threshold - volleyball.velocity.x
             else:
-                delay_velocity = self.state.delay_of_game_velocity_x_threshold + volleyball.velocity.x
-            if volleyball.possession_team == self.state.team_0 and volleyball.position.x < self.state.midline_x: # if volleyball in own half 
+                delay_velocity = state.delay_of_game_velocity_x_threshold + volleyball.velocity.x
+            if possession_team == state.team_0 and volleyball.position.x < midline_x: # if volleyball in own half 
                 if delay_velocity < 0: # if volleyball moving forward enough return negative delay velocity
                     return delay_velocity
-            elif volleyball.possession_team == self.state.team_1 and volleyball.position.x > self.state.midline_x: # if volleyball in own half
+            elif possession_team == state.team_1 and volleyball.position.x > midline_x: # if volleyball in own half
                 if delay_velocity < 0: # if volleyball moving forward enough + use the inverse for team 1 
                     return delay_velocity
             else:
                  return None # volleyball not in own half
-            for other_id, distance in self.state.squared_distances_ball_player[volleyball.id]:
-                player = self.state.players[other_id]
-                if player.team != volleyball.possession_team:
-                    if player.role == PlayerRole.CHASER or player.role == PlayerRole.KEEPER:
-                        if distance < self.state.no_delay_of_game_opponent_chaser_squared_distance_threshold:
+            players = state.players
+            chaser_squared_distance_threshold = state.no_delay_of_game_opponent_chaser_squared_distance_threshold
+            beater_squared_distance_threshold = state.no_delay_of_game_opponent_beater_squared_distance_threshold
+            # distances are sorted, beyond the larger threshold no opponent can prevent the delay of game anymore
+            max_squared_distance_threshold = max(chaser_squared_distance_threshold, beater_squared_distance_threshold)
+            role_chaser = PlayerRole.CHASER
+            role_keeper = PlayerRole.KEEPER
+            role_beater = PlayerRole.BEATER
+            for other_id, distance in state.squared_distances_ball_player[volleyball.id]:
+                if distance >= max_squared_distance_threshold:
+                    break
+                player = players[other_id]
+                if player.team != possession_team:
+                    role = player.role
+                    if role is role_chaser or role is role_keeper:
+                        if distance < chaser_squared_distance_threshold:
                             return None # opponent player close enough to volleyball to prevent delay of game
-                    elif player.role == PlayerRole.BEATER and player.has_ball is not None:
-                        if distance < self.state.no_delay_of_game_opponent_beater_squared_distance_threshold:
+                    elif role is role_beater and player.has_ball is not None:
+                        if distance < beater_squared_distance_threshold:
                             return None # opponent loaded beater close enough to volleyball to prevent delay of game
-                        else:
-                            break # no need to check further players
             return delay_velocity # return how much below threshold the volleyball is
         # delay velocity as weighting factor how severve the delay of game is
         delay_velocity = _check_delay_velocity(volleyball)
@@ -125,28 +138,31 @@ class PenaltyLogic:
         Args:
             ball: The ball to designate turnover for
         """
+        players = self.state.players
+        possession_team = ball.possession_team
+        ball_type = ball.ball_type
         for other_id, distance in self.state.squared_distances_ball_player.get(ball.id, []):
-            player = self.state.players.get(other_id)
+            player = players.get(other_id)
             if player is None:
                 continue
-            if player.team != ball.possession_team:
-                if ball.ball_type == BallType.VOLLEYBALL:
+            if player.team != possession_team:
+                if ball_type == BallType.VOLLEYBALL:
                     if player.role == PlayerRole.CHASER or player.role == PlayerRole.KEEPER:
                         if not player.has_ball:
                             ball.turnover_to_player = player.id
                             if ball.holder_id is not None:
-                                holder = self.state.players.get(ball.holder_id)
+                                holder = players.get(ball.holder_id)
                                 holder.has_ball = False
                                 ball.holder_id = None
                             break
-                elif ball.ball_type == BallType.DODGEBALL:
+                elif ball_type == BallType.DODGEBALL:
                     if player.role == PlayerRole.BEATER:
                         if not player.has_ball:
                             if not player.is_receiving_turnover_ball: # prevent multiple turnover balls to same player
                                 ball.turnover_to_player = player.id
                                 player.is_receiving_turnover_ball = True
                                 if ball.holder_id is not None:
-                                    holder = self.state.players.get(ball.holder_id)
+                                    holder = players.get(ball.holder_id)
                                     holder.has_ball = False
                                     ball.holder_id = None
                                 break
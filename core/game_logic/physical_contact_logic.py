@@ -1,8 +1,8 @@
 from enum import Flag
 import logging
+from operator import itemgetter
 from core.game_logic.utility_logic import UtilityLogic
 from core.game_state import GameState
-from core.entities import Vector2
 
 BASE_LOGGER = logging.getLogger('quadball.game_logic')
 
@@ -31,8 +31,11 @@ class PhysicalContactLogic:
         # TODO add player dependent tackle strength -> probability for enforcing tackle and stealing ball if close enough to steal
         for player in self.state.players.values():
             if len(player.tackling_player_ids) > 0:
-                player.direction = Vector2(0, 0) # stop movement when being tackled or tackling
-                player.velocity = Vector2(0, 0) # stop movement when being tackled or tackling
+                # stop movement when being tackled or tackling, zeroed in place so the entity keeps its vectors
+                player.direction.x = 0
+                player.direction.y = 0
+                player.velocity.x = 0
+                player.velocity.y = 0
                 player.tackling_player_ids = []
 
     def _check_player_collisions(self) -> None:
@@ -55,28 +58,46 @@ class PhysicalContactLogic:
         # reset in contact player ids from last update (in separate loop because in other loop attributes of other players set)
         players = list(self.state.players.values())
         n_players = len(players)
-        for player in players:
+        # position of each player in the iteration order, each pair is only checked from its earlier player
+        # (filled in the same pass as the reset, so the players are walked once before the pair loop)
+        player_indices = {}
+        for i, player in enumerate(players):
             # resetting each update and adding back if still persisting
             player.in_contact_player_ids = []
+            player_indices[player.id] = i
+        player_player_dicts = self.state.squared_distances_player_player_dicts
+        resolve_collision = UtilityLogic._resolve_elastic_entity_collisions
+        get_player_index = player_indices.get
         # for i, player in enumerate(players[:-1]):
         for i in range(n_players - 1):
             player = players[i]
             if player.is_knocked_out:
                 continue
+            # distance row of this player, only holds players within min_squared_distance_player_player_calculation
+            player_distances = player_player_dicts.get(player.id)
+            if not player_distances:
+                continue # no other player close enough to collide
+            player_radius = player.radius
             # for other_id, distance in self._get_sorted_distances(player.id).items():
             # for other_id, distance in self.state.squared_distances.get(player.id, []):
             #     if other_id in list(self.state.players.keys())[i+1:]: # only check each pair once
             #         other_player = self.state.players[other_id]
-            for j in range(i + 1, n_players):
+            colliding = []
+            for other_id, distance in player_distances.items():
+                j = get_player_index(other_id, -1)
+                if j <= i:
+                    continue # pair already checked from the other player or player not in game
                 other_player = players[j]
-                distance = self.state.squared_distances_player_player_dicts.get(player.id, {}).get(other_player.id)
-                if distance is None:
-                    continue
                 if other_player.is_knocked_out:
                     continue
-                collision_dist_sq = (player.radius + other_player.radius) ** 2
-                if distance < collision_dist_sq:
-                    # Collision occurred
-                    player.in_contact_player_ids.append(other_player.id)
-                    other_player.in_contact_player_ids.append(player.id)
-                    UtilityLogic._resolve_elastic_entity_collisions(player, other_player)
+                collision_dist = player_radius + other_player.radius
+                if distance < collision_dist * collision_dist:
+                    colliding.append((j, other_player))
+            if len(colliding) > 1:
+                colliding.sort(key=itemgetter(0))
+            for _, other_player in colliding:
+                # Collision occurred
+                player.in_contact_player_ids.append(other_player.id)
+                other_player.in_contact_player_ids.append(player.id)
+                # resolved pair by pair in order: later pairs see the velocities changed by earlier ones
+                resolve_collision(player, other_player)
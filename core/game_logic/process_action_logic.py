@@ -1,6 +1,6 @@
 import logging
+import math
 from typing import Optional
-from core.game_logic.utility_logic import UtilityLogic
 from core.game_state import GameState
 from core.entities import Player, Ball, VolleyBall, DodgeBall, Vector2, PlayerRole, BallType
 
@@ -58,13 +58,15 @@ class ProcessActionLogic:
         ball.holder_id = None
         if throw_direction is None:
             throw_direction = player.direction
-        mag_dir = UtilityLogic._magnitude(throw_direction)
-        if mag_dir > 1:
-            throw_direction.x /= mag_dir
-            throw_direction.y /= mag_dir
+        # decide on the squared magnitude, the square root is only taken in the branch that needs it
+        mag_dir_sq = throw_direction.x * throw_direction.x + throw_direction.y * throw_direction.y
+        if mag_dir_sq > 1:
+            inv_mag_dir = 1.0 / math.sqrt(mag_dir_sq)
+            throw_direction.x *= inv_mag_dir
+            throw_direction.y *= inv_mag_dir
             mag_velocity = player.throw_velocity # mag velocity should be same as player throw velocity because throw direction is normalized
         else:
-            mag_velocity = player.throw_velocity * mag_dir # if throw direction is not normalized, scale velocity by mag_dir to prevent faster throws in diagonal directions
+            mag_velocity = player.throw_velocity * math.sqrt(mag_dir_sq) # if throw direction is not normalized, scale velocity by mag_dir to prevent faster throws in diagonal directions
 
         ball.velocity.x = player.throw_velocity * throw_direction.x
         ball.velocity.y = player.throw_velocity * throw_direction.y
@@ -114,9 +116,10 @@ class ProcessActionLogic:
         #                         print(f"[GAME] Player {player_id} tackled player {other_id}")
         if not player.has_ball:
             if len(player.in_contact_player_ids) > 0:
+                players = self.state.players
                 for other_id in player.in_contact_player_ids:
-                    if other_id in self.state.players.keys():
-                        other_player = self.state.players[other_id]
+                    other_player = players.get(other_id)
+                    if other_player is not None:
                         # only tackling player with ball allowed
                         if other_player.has_ball:
                             if other_player.team != player.team:
@@ -4,6 +4,9 @@ from operator import itemgetter
 import math
 # from numba import jit
 
+# ids of the center hoop per team (as created with the pitch), so per frame lookups need no f-string
+CENTER_HOOP_IDS = {team: f'hoop_{team}_center' for team in (GameState.team_0, GameState.team_1)}
+
 class UtilityLogic:
     """
     Provides shared utility calculations for game logic systems.
@@ -20,6 +23,8 @@ class UtilityLogic:
             game_state: The active GameState instance.
         """
         self.state = game_state
+        # (seeker_on_pitch, min_squared_distance_player_player_calculation, player_rows, ball_rows) of the last rebuild
+        self._last_distance_inputs: tuple | None = None
 
     def _calculate_distances(self) -> None:
         """
@@ -40,77 +45,170 @@ class UtilityLogic:
         - Beater-Volleyball pairs (beaters don't interact with volleyball)
         
         This precomputation enables efficient collision detection in subsequent methods.
-        """
 
-        players = list(self.state.players.values())
-        n_players = len(players)
-        balls = list(self.state.balls.values())
+        Runs every frame over all pairs, so state containers, positions and the role
+        checks are resolved once per entity into locals before the pair loops and the
+        squared distance is computed inline instead of calling _squared_distance.
+
+        If no input changed since the last rebuild (no entity moved, was added/removed,
+        knocked out or changed role), the caches are still exact and the rebuild is skipped.
+        """
+        state = self.state
+        players = list(state.players.values())
+        balls = list(state.balls.values())
         n_balls = len(balls)
+        max_player_player: float = state.min_squared_distance_player_player_calculation
+        seeker_on_pitch: bool = state.seeker_on_pitch
+        if self._distance_inputs_unchanged(players, balls):
+            return
 
         # reset squared_distances_dicts to prevent stale data
+        player_player_dicts: dict[str, dict[str, float]] = state.squared_distances_player_player_dicts
+        ball_ball_dicts: dict[str, dict[str, float]] = state.squared_distances_ball_ball_dicts
+        ball_player_dicts: dict[str, dict[str, float]] = state.squared_distances_ball_player_dicts
         for player in players:
-            self.state.squared_distances_player_player_dicts[player.id] = {}
+            player_player_dicts[player.id] = {}
         for ball in balls:
-            self.state.squared_distances_ball_ball_dicts[ball.id] = {}
-            self.state.squared_distances_ball_player_dicts[ball.id] = {}
-        self.state.squared_distances_player_player = {}
-        self.state.squared_distances_ball_player = {}
-
-        for i in range(n_players - 1):
-            player_1 = players[i]
-            if player_1.is_knocked_out:
+            ball_ball_dicts[ball.id] = {}
+            ball_player_dicts[ball.id] = {}
+
+        # per active player once: (id, x, y, is_beater, is_seeker, is_chaser_or_keeper, dict, player, role)
+        # enum members bound to locals, a PlayerRole.X lookup goes through the enum metaclass each time
+        role_beater = PlayerRole.BEATER
+        role_seeker = PlayerRole.SEEKER
+        role_keeper = PlayerRole.KEEPER
+        role_chaser = PlayerRole.CHASER
+        player_rows = []
+        for player in players:
+            if player.is_knocked_out:
                 continue # knocked out players do not interact with game
-            for j in range(i + 1, n_players):
-                player_2 = players[j]
-                if player_2.is_knocked_out:
-                    continue # knocked out players do not interact with game
+            role = player.role
+            player_rows.append((
+                player.id,
+                player.position.x,
+                player.position.y,
+                role is role_beater,
+                role is role_seeker,
+                role is role_keeper or role is role_chaser,
+                player_player_dicts[player.id],
+                player,
+                role,
+            ))
+
+        # sweep and prune: with the players sorted by x, the inner loop can stop as soon as
+        # the x gap alone exceeds the player-player calculation distance
+        sorted_player_rows = sorted(player_rows, key=itemgetter(1))
+        n_active_players = len(sorted_player_rows)
+        for i in range(n_active_players - 1):
+            id_1, x_1, y_1, is_beater_1, is_seeker_1, is_quaffle_player_1, dict_1, _, _ = sorted_player_rows[i]
+            for j in range(i + 1, n_active_players):
+                id_2, x_2, y_2, is_beater_2, is_seeker_2, is_quaffle_player_2, dict_2, _, _ = sorted_player_rows[j]
+                dx = x_2 - x_1
+                dx_squared = dx*dx
+                if dx_squared > max_player_player:
+                    break # all following players are even further away in x
                 # Skip keeper-beater and chaser-beater combinations (any order)
-                if ((player_1.role == PlayerRole.BEATER and player_2.role in (PlayerRole.KEEPER, PlayerRole.CHASER)) or
-                    (player_2.role == PlayerRole.BEATER and player_1.role in (PlayerRole.KEEPER, PlayerRole.CHASER))):
+                if (is_beater_1 and is_quaffle_player_2) or (is_beater_2 and is_quaffle_player_1):
                     continue
                 # skip seeker-player combinations except for seeker-seeker
-                if (player_1.role == PlayerRole.SEEKER and player_2.role != PlayerRole.SEEKER) or (player_2.role == PlayerRole.SEEKER and player_1.role != PlayerRole.SEEKER):
+                if is_seeker_1 != is_seeker_2:
                     continue
                 # Store squared distance for the pair
-                squared_distance = self._squared_distance(player_1.position, player_2.position)
-                if squared_distance <= self.state.min_squared_distance_player_player_calculation:
-                    self.state.squared_distances_player_player_dicts[player_1.id][player_2.id] = squared_distance
-                    self.state.squared_distances_player_player_dicts[player_2.id][player_1.id] = squared_distance
+                dy = y_1 - y_2
+                squared_distance = dx_squared + dy*dy
+                if squared_distance <= max_player_player:
+                    dict_1[id_2] = squared_distance
+                    dict_2[id_1] = squared_distance
 
+        ball_type_volleyball = BallType.VOLLEYBALL
+        ball_rows = [
+            (ball.id, ball.position.x, ball.position.y, ball.ball_type is ball_type_volleyball)
+            for ball in balls
+        ]
         for i in range(n_balls - 1):
-            ball_1 = balls[i]
+            id_1, x_1, y_1, _ = ball_rows[i]
+            dict_1 = ball_ball_dicts[id_1]
             # no filtering out dead volleyball because in check volleyball possesion keeper can pick up dead volleyball
             for j in range(i + 1, n_balls):
-                ball_2 = balls[j]
-                squared_distance = self._squared_distance(ball_1.position, ball_2.position)
-                self.state.squared_distances_ball_ball_dicts[ball_1.id][ball_2.id] = squared_distance
-                self.state.squared_distances_ball_ball_dicts[ball_2.id][ball_1.id] = squared_distance
+                id_2, x_2, y_2, _ = ball_rows[j]
+                dx = x_1 - x_2
+                dy = y_1 - y_2
+                squared_distance = dx*dx + dy*dy
+                dict_1[id_2] = squared_distance
+                ball_ball_dicts[id_2][id_1] = squared_distance
 
-        for player in players:
-            if player.is_knocked_out:
-                continue # knocked out players do not interact with game
-            for ball in balls:
-                # Skip beater-volleyball and seeker-volleyball combinations (any order) and seeker-dodgeball combinations when seekers not on pitch
-                # no additional check in volleyball logic
-                if (player.role == PlayerRole.BEATER and ball.ball_type == BallType.VOLLEYBALL):
+        # ball-player pairs go into the lookup dict and straight into the (id, distance) list
+        # that is sorted in place below, so the dict items are not copied out again
+        squared_distances_ball_player = {ball.id: [] for ball in balls}
+        ball_targets = [
+            (ball_id, x_b, y_b, is_volleyball, ball_player_dicts[ball_id], squared_distances_ball_player[ball_id])
+            for ball_id, x_b, y_b, is_volleyball in ball_rows
+        ]
+        for row in player_rows:
+            player_id, x_p, y_p, is_beater, is_seeker, _, _, _, _ = row
+            # Skip beater-volleyball and seeker-volleyball combinations (any order) and seeker-dodgeball combinations when seekers not on pitch
+            # no additional check in volleyball logic
+            if is_seeker and not seeker_on_pitch:
+                continue
+            skip_volleyball = is_beater or is_seeker
+            for ball_id, x_b, y_b, is_volleyball, ball_distances, ball_distance_list in ball_targets:
+                if is_volleyball and skip_volleyball:
                     continue
-                if player.role == PlayerRole.SEEKER:
-                    if not self.state.seeker_on_pitch:
-                        continue
-                    if ball.ball_type == BallType.VOLLEYBALL:
-                        continue
-                squared_distance = self._squared_distance(player.position, ball.position)
-                # player_ball not needed
-                # self.state.squared_distances_player_ball[player.id][ball.id] = squared_distance
-                self.state.squared_distances_ball_player_dicts[ball.id][player.id] = squared_distance
+                dx = x_p - x_b
+                dy = y_p - y_b
+                squared_distance = dx*dx + dy*dy
+                ball_distances[player_id] = squared_distance
+                ball_distance_list.append((player_id, squared_distance))
 
+        # player-player dicts only hold pairs within min_squared_distance_player_player_calculation,
+        # so most are empty or hold a single neighbour and need no sort call
+        distance_key = itemgetter(1)
+        squared_distances_player_player = {}
         for player in players:
-            self.state.squared_distances_player_player[player.id] = sorted(self.state.squared_distances_player_player_dicts[player.id].items(), key=itemgetter(1))
-            # self.state.squared_distances_player_ball[player.id] = sorted(self.state.squared_distances_player_ball_dicts[player.id].items(), key=itemgetter(1))
+            distances = player_player_dicts[player.id]
+            if len(distances) > 1:
+                squared_distances_player_player[player.id] = sorted(distances.items(), key=distance_key)
+            else:
+                squared_distances_player_player[player.id] = list(distances.items())
+        state.squared_distances_player_player = squared_distances_player_player
+        for ball_distance_list in squared_distances_ball_player.values():
+            ball_distance_list.sort(key=distance_key)
+        state.squared_distances_ball_player = squared_distances_ball_player
+        self._last_distance_inputs = (seeker_on_pitch, max_player_player, player_rows, ball_rows)
 
-        for ball in balls:
-            # self.state.squared_distances_ball_ball[ball.id] = sorted(self.state.squared_distances_dicts[ball.id].items(), key=itemgetter(1))
-            self.state.squared_distances_ball_player[ball.id] = sorted(self.state.squared_distances_ball_player_dicts[ball.id].items(), key=itemgetter(1))
+    def _distance_inputs_unchanged(self, players: list[Player], balls: list[Ball]) -> bool:
+        """
+        Check whether the inputs of _calculate_distances are exactly those of the last rebuild.
+
+        Positions are compared exactly, so a skipped rebuild never leaves a stale distance.
+        Bails out at the first difference, which is usually the first entity while play is running.
+        """
+        if self._last_distance_inputs is None:
+            return False
+        last_seeker_on_pitch, last_max_player_player, last_player_rows, last_ball_rows = self._last_distance_inputs
+        if len(balls) != len(last_ball_rows):
+            return False
+        for ball, (ball_id, x, y, _) in zip(balls, last_ball_rows):
+            if ball.position.x != x or ball.position.y != y or ball.id != ball_id:
+                return False
+        n_last_player_rows = len(last_player_rows)
+        row_index = 0
+        for player in players:
+            if player.is_knocked_out:
+                continue
+            if row_index == n_last_player_rows:
+                return False
+            _, x, y, _, _, _, _, last_player, last_role = last_player_rows[row_index]
+            if player is not last_player or player.position.x != x or player.position.y != y or player.role != last_role:
+                return False
+            row_index += 1
+        if row_index != n_last_player_rows:
+            return False
+        state = self.state
+        return (
+            state.seeker_on_pitch == last_seeker_on_pitch
+            and state.min_squared_distance_player_player_calculation == last_max_player_player
+        )
 
 
     #     entities_list = list(list(self.state.players.values()) + list(self.state.balls.values()))
@@ -222,7 +320,7 @@ class UtilityLogic:
         """
         dx = pos1.x - pos2.x
         dy = pos1.y - pos2.y
-        return dx**2 + dy**2
+        return dx*dx + dy*dy
     
     @staticmethod
     def _magnitude(vector: Vector2) -> float:
@@ -237,56 +335,50 @@ class UtilityLogic:
     @staticmethod
     def _squared_sum(value_1: float, value_2: float) -> float:
         """Return sum of squared scalar components."""
-        return value_1**2 + value_2**2
+        return value_1*value_1 + value_2*value_2
 
     @staticmethod
     def _resolve_elastic_entity_collisions(entity, other_entity) -> None:
         """
         Resolve collisions between entities by adjusting their velocities based on collision physics.
         """
-        normal = Vector2(
-            other_entity.position.x - entity.position.x,
-            other_entity.position.y - entity.position.y
-        )
-        normal_mag = UtilityLogic._magnitude(normal)
+        # plain floats instead of Vector2 temporaries, this runs for every colliding pair every frame
+        entity_velocity = entity.velocity
+        other_velocity = other_entity.velocity
+        normal_x = other_entity.position.x - entity.position.x
+        normal_y = other_entity.position.y - entity.position.y
+        normal_mag = math.hypot(normal_x, normal_y)
         if normal_mag == 0:
             return # avoid divide by zero
-        normal.x /= normal_mag
-        normal.y /= normal_mag
-        dot_entity = entity.velocity.x * normal.x + entity.velocity.y * normal.y
-        dot_other = other_entity.velocity.x * normal.x + other_entity.velocity.y * normal.y
+        normal_x /= normal_mag
+        normal_y /= normal_mag
+        dot_entity = entity_velocity.x * normal_x + entity_velocity.y * normal_y
+        dot_other = other_velocity.x * normal_x + other_velocity.y * normal_y
         if dot_entity < 0 and dot_other > 0:
             return # both moving away from each other
-        # split velcoity into contribution along connecting vector and perpendicular to it
-        entity_velocity_along_normal = Vector2(normal.x * dot_entity, normal.y * dot_entity)
-        entity_velocity_perpendicular = Vector2(
-            entity.velocity.x - entity_velocity_along_normal.x,
-            entity.velocity.y - entity_velocity_along_normal.y
-        )
-        other_velocity_along_normal = Vector2(normal.x * dot_other, normal.y * dot_other)
-        other_velocity_perpendicular = Vector2(
-            other_entity.velocity.x - other_velocity_along_normal.x,
-            other_entity.velocity.y - other_velocity_along_normal.y
-        )
+        # normal is a unit vector, so the speeds along it are |dot|: compare their squares instead of magnitudes
         if dot_entity > 0 and dot_other > 0: # entity moves towards other entity
-            mag_entity_vel_along_normal = UtilityLogic._magnitude(entity_velocity_along_normal)
-            mag_other_vel_along_normal = UtilityLogic._magnitude(other_velocity_along_normal)
-            if mag_entity_vel_along_normal < mag_other_vel_along_normal: # entity slower than other so no pushing
+            if dot_entity * dot_entity < dot_other * dot_other: # entity slower than other so no pushing
                 return
         elif dot_entity < 0 and dot_other < 0: # other entity moves towards entity
-            mag_entity_vel_along_normal = UtilityLogic._magnitude(entity_velocity_along_normal)
-            mag_other_vel_along_normal = UtilityLogic._magnitude(other_velocity_along_normal)
-            if mag_entity_vel_along_normal > mag_other_vel_along_normal: # other entity slower than entity so no pushing
+            if dot_entity * dot_entity > dot_other * dot_other: # other entity slower than entity so no pushing
                 return
             # else both moving towards each other or one stationary
-        combined_velocity_along_normal = Vector2(
-            (entity_velocity_along_normal.x + other_velocity_along_normal.x) * 0.5,
-            (entity_velocity_along_normal.y + other_velocity_along_normal.y) * 0.5
-        )
-        entity.velocity.x = combined_velocity_along_normal.x + entity_velocity_perpendicular.x
-        entity.velocity.y = combined_velocity_along_normal.y + entity_velocity_perpendicular.y
-        other_entity.velocity.x = combined_velocity_along_normal.x + other_velocity_perpendicular.x
-        other_entity.velocity.y = combined_velocity_along_normal.y + other_velocity_perpendicular.y
+        # split velcoity into contribution along connecting vector and perpendicular to it
+        entity_along_x = normal_x * dot_entity
+        entity_along_y = normal_y * dot_entity
+        other_along_x = normal_x * dot_other
+        other_along_y = normal_y * dot_other
+        entity_perpendicular_x = entity_velocity.x - entity_along_x
+        entity_perpendicular_y = entity_velocity.y - entity_along_y
+        other_perpendicular_x = other_velocity.x - other_along_x
+        other_perpendicular_y = other_velocity.y - other_along_y
+        combined_along_x = (entity_along_x + other_along_x) * 0.5
+        combined_along_y = (entity_along_y + other_along_y) * 0.5
+        entity_velocity.x = combined_along_x + entity_perpendicular_x
+        entity_velocity.y = combined_along_y + entity_perpendicular_y
+        other_velocity.x = combined_along_x + other_perpendicular_x
+        other_velocity.y = combined_along_y + other_perpendicular_y
         # TODO: deal with boundaries close to entitys
 
     # numba more useful if more complex calculations, more looping
@@ -1,7 +1,8 @@
 import logging
 import math
 from core.game_state import GameState
-from core.entities import Player, Ball, VolleyBall, DodgeBall, Vector2, PlayerRole, BallType
+from core.game_logic.utility_logic import CENTER_HOOP_IDS
+from core.entities import Player, Ball, VolleyBall, DodgeBall, Vector2, PlayerRole, BallType, Hoop
 
 BASE_LOGGER = logging.getLogger('quadball.game_logic')
 
@@ -22,6 +23,8 @@ class VolleyballLogic:
         """
         self.state = game_state
         self.logger = logger or BASE_LOGGER
+        self._team_hoops: dict[int, list[tuple[str, Hoop]]] | None = None
+        self._team_hoops_n_hoops = 0
 
     def _check_volleyball_possessions(self) -> None:
         """
@@ -43,12 +46,16 @@ class VolleyballLogic:
             return  # Volleyball either doesn't exist or is held
         if volleyball.holder_id is not None:
             return # volleyball already in possession
-        max_pickup_dist_sq = (volleyball.radius + self.state.max_player_radius) ** 2
+        volleyball_radius = volleyball.radius
+        max_pickup_dist = volleyball_radius + self.state.max_player_radius
+        max_pickup_dist_sq = max_pickup_dist * max_pickup_dist
         # for other_id, distance in self._get_sorted_distances(volleyball.id).items():
+        # ball-player lists only hold player ids, resolve them with one bound dict lookup each
+        get_player = self.state.players.get
         for other_id, distance in self.state.squared_distances_ball_player.get(volleyball.id, []):
             if distance > max_pickup_dist_sq:
                 break
-            player = self.state.players.get(other_id)
+            player = get_player(other_id)
             if player is None:
                 continue
             if volleyball.turnover_to_player is not None and volleyball.turnover_to_player != player.id:
@@ -59,7 +66,8 @@ class VolleyballLogic:
                         continue # only keeper possess dead volleyball
                     # only calculated distances for chaser-keeper pairs
                     # if player.role == PlayerRole.CHASER or player.role == PlayerRole.KEEPER:
-                    if distance < (player.radius + volleyball.radius) ** 2:
+                    pickup_dist = player.radius + volleyball_radius
+                    if distance < pickup_dist * pickup_dist:
                         if volleyball.inbounder is None or player.id == volleyball.inbounder: # no inbounding or inbounding player
                             # Player picks up the volleyball
                             volleyball.holder_id = player.id
@@ -99,27 +107,40 @@ class VolleyballLogic:
             return # Dead volleyball cannot score
         if volleyball.turnover_to_player is not None:
             return # volleyball in turnover cannot score
+        previous_x = volleyball.previous_position.x
+        current_x = volleyball.position.x
+        if previous_x < current_x:
+            moved_min_x, moved_max_x = previous_x, current_x
+        else:
+            moved_min_x, moved_max_x = current_x, previous_x
+        team_hoops = self._get_team_hoops()
         for team in [0, 1]:
-            hoop_x = self.state.hoops[f'hoop_{team}_center'].position.x
-            steps_to_hoops = (hoop_x - volleyball.previous_position.x) / (volleyball.position.x - volleyball.previous_position.x) if volleyball.previous_position.x != volleyball.position.x else float('inf')
+            hoop_x = self.state.hoops[CENTER_HOOP_IDS[team]].position.x
+            if previous_x == current_x or not (moved_min_x <= hoop_x <= moved_max_x):
+                continue # hoop line not within the x movement of this frame, no crossing possible
+            steps_to_hoops = (hoop_x - previous_x) / (current_x - previous_x)
             if steps_to_hoops > 0 and steps_to_hoops < 1: # crossed hoop this frame
-                for hoop_id, hoop in self.state.hoops.items():
-                    if hoop.team == team:
-                        y_hoop = hoop.position.y
-                        # Check if ball is at hoop height
-                        if volleyball.position.y >= y_hoop - hoop.radius and volleyball.position.y <= y_hoop + hoop.radius:
-                            # print(f'volleyball crossed hoop {hoop_id} at y={volleyball.position.y}, hoop y={y_hoop}')
-                            if volleyball.crossed_hoop is None:
-                                volleyball.crossed_hoop = (hoop_id, volleyball.position.y)
-                            else:
-                                volleyball.crossed_hoop = None # volleyball crossed back before fully through e.g. by keeper or dodgeball collision
-                                self.logger.debug('Volleyball crossed back before fully through hoop')
-                            break
+                crossed_this_frame = False
+                for hoop_id, hoop in team_hoops.get(team, ()):
+                    y_hoop = hoop.position.y
+                    # Check if ball is at hoop height
+                    if volleyball.position.y >= y_hoop - hoop.radius and volleyball.position.y <= y_hoop + hoop.radius:
+                        if volleyball.crossed_hoop is None:
+                            volleyball.crossed_hoop = (hoop_id, volleyball.position.y)
+                        else:
+                            volleyball.crossed_hoop = None # volleyball crossed back before fully through e.g. by keeper or dodgeball collision
+                            self.logger.debug('Volleyball crossed back before fully through hoop')
+                        crossed_this_frame = True
+                        break
+                if crossed_this_frame:
+                    break # the hoop lines of both teams cannot be crossed in the same frame
         if volleyball.crossed_hoop is not None:
             hoop_id, cross_y = volleyball.crossed_hoop
             hoop = self.state.hoops[hoop_id]
-            passed_squared_distance = (volleyball.position.x - hoop.position.x) ** 2 + (volleyball.position.y - cross_y) ** 2
-            if passed_squared_distance > volleyball.radius ** 2: # whole ball has passed through hoop
+            passed_x = volleyball.position.x - hoop.position.x
+            passed_y = volleyball.position.y - cross_y
+            passed_squared_distance = passed_x * passed_x + passed_y * passed_y
+            if passed_squared_distance > volleyball.radius * volleyball.radius: # whole ball has passed through hoop
                 # Goal scored!
                 if hoop.team == self.state.team_0:
                     scoring_team = self.state.team_1
@@ -164,6 +185,22 @@ class VolleyballLogic:
             # print(f"[GAME] Goal! Team {hoop.team} scores 10 points")
 
 
+    def _get_team_hoops(self) -> dict[int, list[tuple[str, Hoop]]]:
+        """
+        Return the (hoop id, hoop) pairs per team.
+
+        Hoops do not move during a game, so the grouping is cached and only rebuilt
+        when the set of hoops changes (e.g. once the pitch is initialized).
+        """
+        hoops = self.state.hoops
+        if self._team_hoops is None or self._team_hoops_n_hoops != len(hoops):
+            team_hoops = {}
+            for hoop_id, hoop in hoops.items():
+                team_hoops.setdefault(hoop.team, []).append((hoop_id, hoop))
+            self._team_hoops = team_hoops
+            self._team_hoops_n_hoops = len(hoops)
+        return self._team_hoops
+
     def make_volleyball_alive(self) -> None:
         """
         Make the dead volleyball alive when the keeper brings it back into play.
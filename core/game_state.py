@@ -27,6 +27,9 @@ class GameState:
     squared_distances_player_player_dicts: Dict[str, Dict[str, float]] = field(default_factory=dict)   # Nested dict for faster lookups: {entity_id: {other_entity_id: squared_distance}}
     squared_distances_ball_ball_dicts: Dict[str, Dict[str, float]] = field(default_factory=dict)     # Nested dict for player-ball distances: {player_id: {ball_id: squared_distance}}
     squared_distances_ball_player_dicts: Dict[str, Dict[str, float]] = field(default_factory=dict)   # Nested dict for player-ball distances: {ball_id: {player_id: squared_distance}}
+    # The sorted lists below are built once per frame by UtilityLogic._calculate_distances and shared by all
+    # consumers (possession, beats, inbounding, free ways, delay of game, computer player), which walk them
+    # nearest-first and break at their distance threshold. Do not re-sort them per caller.
     squared_distances_player_player: Dict[str, List[Tuple[str, float]]] = field(default_factory=dict)          # Dictionary mapping entity_id -> list of (other_entity_id, squared_distance) tuples, sorted by distance
     squared_distances_ball_player: Dict[str, List[Tuple[str, float]]] = field(default_factory=dict)          # Dictionary mapping entity_id -> list of (other_entity_id, squared_distance) tuples, sorted by distance
     min_squared_distance_player_player_calculation: float = 4 # only calculate and store distances for player pairs that are within this squared distance to save on calculations and memory, since distant players won't interact with each other
@@ -137,6 +140,10 @@ class GameState:
             self.players[player.id] = player
 
     def copy(self) -> 'GameState':
+        players = {pid: player.copy() for pid, player in self.players.items()}
+        # keeper references point to the copied players, like the replay restore in room_jsonl_logger
+        keeper_team_0 = players.get(self.keeper_team_0.id) if self.keeper_team_0 is not None else None
+        keeper_team_1 = players.get(self.keeper_team_1.id) if self.keeper_team_1 is not None else None
         return GameState(
             is_game_active=self.is_game_active,
             boundaries_x=self.boundaries_x,
@@ -144,7 +151,9 @@ class GameState:
             keeper_zone_x_0=self.keeper_zone_x_0,
             keeper_zone_x_1=self.keeper_zone_x_1,
             midline_x=self.midline_x,
-            players={pid: player.copy() for pid, player in self.players.items()},
+            players=players,
+            keeper_team_0=keeper_team_0,
+            keeper_team_1=keeper_team_1,
             balls={bid: ball.copy() for bid, ball in self.balls.items()},
             volleyball=self.volleyball.copy(),
             dodgeballs=[dodgeball.copy() for dodgeball in self.dodgeballs],
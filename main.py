@@ -1469,9 +1469,9 @@ async def game_loop_manager():
             avg_cpu_player_time = sum(cpu_player_times) * 1000 / (100) if cpu_player_times else 0
             max_logic_update_time = max(logic_update_times) * 1000 if logic_update_times else 0
             max_cpu_player_time = max(cpu_player_times) * 1000 if cpu_player_times else 0
-            print(f"Tick {tick_counter} - Avg logic update time: {avg_logic_update_time:.1f}ms,  Max logic update time: {max_logic_update_time:.1f}ms")
+            logger.info("Tick %s - Avg logic update time: %.1fms,  Max logic update time: %.1fms", tick_counter, avg_logic_update_time, max_logic_update_time)
             # print(f"logic update time list: {logic_update_times}")
-            print(f"Average CPU player time: {avg_cpu_player_time:.1f}ms, Max CPU player time: {max_cpu_player_time:.1f}ms")
+            logger.info("Average CPU player time: %.1fms, Max CPU player time: %.1fms", avg_cpu_player_time, max_cpu_player_time)
             # print(f"cpu player time list: {cpu_player_times}")
             logic_update_times.clear()
             cpu_player_times.clear()
@@ -98,17 +98,31 @@ def _object_field_names(value) -> list[str]:
     Dataclass fields come first, followed by any extra instance attributes assigned
     outside the dataclass machinery. VolleyBall, DodgeBall and FlagRunner all subclass
     a dataclass with a hand written __init__, so without the second part their own
-    attributes would never reach the log.
+    attributes would never reach the log. Slotted classes (Vector2, Player, Ball and
+    its subclasses) have no instance __dict__, so their extra attributes are taken
+    from the declared __slots__ instead, in declaration order.
     """
     if is_dataclass(value):
         field_names = [field.name for field in fields(value)]
         known_field_names = set(field_names)
         field_names.extend(
-            key for key in vars(value)
+            key for key in _instance_attribute_names(value)
             if key not in known_field_names and not key.startswith('_') and not callable(getattr(value, key, None))
         )
         return field_names
-    return [key for key in vars(value).keys() if not key.startswith('_') and not callable(getattr(value, key))]
+    return [key for key in _instance_attribute_names(value) if not key.startswith('_') and not callable(getattr(value, key))]
+
+
+def _instance_attribute_names(value) -> list[str]:
+    """Instance attribute names from __slots__ (base classes first) and __dict__."""
+    names = []
+    for cls in reversed(type(value).__mro__):
+        slots = cls.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(name for name in slots if name not in ('__dict__', '__weakref__') and hasattr(value, name))
+    names.extend(key for key in getattr(value, '__dict__', {}) if key not in names)
+    return names
 
 
 def _quantize_float16(value: float) -> float:
@@ -529,11 +543,12 @@ def _serialize_for_jsonl(obj, _seen: Optional[set[int]] = None):
         finally:
             _seen.discard(obj_id)
 
-    if hasattr(obj, '__dict__'):
+    if is_dataclass(obj) or hasattr(obj, '__dict__'):
         _seen.add(obj_id)
         try:
             data = {}
-            for key, value in vars(obj).items():
+            for key in _instance_attribute_names(obj):
+                value = getattr(obj, key)
                 if callable(value) or key.startswith('_'):
                     continue
                 data[str(key)] = _serialize_for_jsonl(value, _seen)